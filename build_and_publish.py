@@ -8,27 +8,269 @@ Created: 2026-01-14
 Updated: 2026-01-14
 """
 
+import asyncio
+import contextlib
+import functools
+import importlib.metadata
+import importlib.util
+import hashlib
+import json
+import shutil
 import subprocess
 import sys
 import os
+import runpy
 from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
 
 
-def run_command(command: str, check: bool = True) -> subprocess.CompletedProcess:
-    """Run a command and return the result."""
-    print(f"Running: {command}")
-    result = subprocess.run(command, shell=True, capture_output=True, text=True, check=check)
-    if result.stdout:
-        print(f"Output: {result.stdout}")
+# Directory holding the "last-passed" fingerprint of each pre-flight stage
+BUILD_CACHE_DIR = Path(".build_cache")
+
+# Commit at which the tests and code quality checks last passed
+PREFLIGHT_REF_FILE = BUILD_CACHE_DIR / "preflight.ref"
+
+# Source trees whose contents feed the tests and code quality checks
+CHECK_INPUT_PATHS = ["data_retrieval", "tests"]
+
+# Configuration files read by pytest and the code quality tools
+CHECK_CONFIG_FILES = ["pyproject.toml", "setup.cfg", "tox.ini", ".flake8", "mypy.ini", ".isort.cfg", "pytest.ini"]
+
+# Top-level entries removed before building (plus any *.egg-info)
+BUILD_ARTIFACT_NAMES = {"build", "dist"}
+
+# Fingerprint of the sources the artifacts in dist/ were built from
+DIST_FINGERPRINT_FILE = Path("dist") / ".fingerprint"
+
+# Quality tools and a probe printing all their versions from a single interpreter
+QUALITY_TOOLS = ["black", "isort", "mypy", "flake8"]
+TOOL_VERSION_PROBE = (
+    "import black, isort, mypy.version, flake8; "
+    "print(black.__version__, isort.__version__, mypy.version.__version__, flake8.__version__)"
+)
+
+# Python tools run inside a long-lived QualityWorker instead of their own interpreter,
+# when they can be imported by this interpreter
+WORKER_TOOLS = {"black", "isort", "flake8"}
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_executable(name: str) -> str:
+    """Resolve an executable to its absolute path once, instead of walking $PATH per call."""
+    if name == "python":
+        return sys.executable
+    return shutil.which(name) or name
+
+
+def run_command(command: List[str], check: bool = True, capture: bool = False) -> subprocess.CompletedProcess:
+    """
+    Run a command and return the result.
+
+    Output goes straight to the terminal unless capture is set, in which case
+    it is collected on the returned result for the caller to parse.
+    """
+    print(f"Running: {' '.join(command)}")
+    argv = [_resolve_executable(command[0]), *command[1:]]
+    if not capture:
+        return subprocess.run(argv, check=check)
+    result = subprocess.run(argv, capture_output=True, text=True, check=check)
     if result.stderr:
         print(f"Error: {result.stderr}")
     return result
 
 
+async def run_command_async(cmd_argv: List[str], check: bool = True) -> subprocess.CompletedProcess:
+    """Run a command without blocking the event loop, streaming its output line by line."""
+    print(f"Running: {' '.join(cmd_argv)}")
+    proc = await asyncio.create_subprocess_exec(
+        _resolve_executable(cmd_argv[0]),
+        *cmd_argv[1:],
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+    )
+    # Prefix each line with the tool name as concurrent commands interleave
+    async for line in proc.stdout:
+        print(f"[{cmd_argv[0]}] {line.decode()}", end="")
+    await proc.wait()
+    result = subprocess.CompletedProcess(args=cmd_argv, returncode=proc.returncode)
+    if check:
+        result.check_returncode()
+    return result
+
+
+class QualityWorker:
+    """
+    Long-lived Python subprocess running a quality tool in-process.
+
+    Requests are served one at a time, so the interpreter start-up and tool
+    imports are paid once rather than once per request. Each tool gets its own
+    worker, so the tools still run concurrently.
+    """
+
+    def __init__(self) -> None:
+        self._proc: Optional[asyncio.subprocess.Process] = None
+        self._lock = asyncio.Lock()
+
+    async def run(self, cmd_argv: List[str], check: bool = True) -> subprocess.CompletedProcess:
+        """Run a tool in the worker and return the result."""
+        async with self._lock:
+            if self._proc is None:
+                self._proc = await asyncio.create_subprocess_exec(
+                    sys.executable, "-u", str(Path(__file__).resolve()), "--worker",
+                    stdin=asyncio.subprocess.PIPE,
+                    stdout=asyncio.subprocess.PIPE,
+                )
+            print(f"Running (worker): {' '.join(cmd_argv)}")
+            request = {"tool": cmd_argv[0], "args": cmd_argv[1:]}
+            self._proc.stdin.write((json.dumps(request) + "\n").encode())
+            await self._proc.stdin.drain()
+            response = await self._proc.stdout.readline()
+        # An empty response means the worker died mid-request
+        returncode = json.loads(response)["returncode"] if response else 1
+        result = subprocess.CompletedProcess(args=cmd_argv, returncode=returncode)
+        if check:
+            result.check_returncode()
+        return result
+
+    async def close(self) -> None:
+        """Shut down the worker."""
+        if self._proc is not None:
+            self._proc.stdin.close()
+            await self._proc.wait()
+            self._proc = None
+
+
+def _run_worker() -> None:
+    """
+    Serve QualityWorker requests read as JSON lines from stdin.
+
+    Each tool is run through its __main__ module with output redirected to
+    stderr, so stdout only carries the {"tool", "returncode"} result lines.
+    """
+    protocol_out = sys.stdout
+    for line in sys.stdin:
+        request = json.loads(line)
+        sys.argv = [request["tool"], *request["args"]]
+        returncode = 0
+        with contextlib.redirect_stdout(sys.stderr):
+            try:
+                runpy.run_module(request["tool"], run_name="__main__", alter_sys=True)
+            except SystemExit as e:
+                returncode = e.code if isinstance(e.code, int) else int(e.code is not None)
+            except Exception as e:
+                print(f"{request['tool']} crashed: {e}")
+                returncode = 1
+        protocol_out.write(json.dumps({"tool": request["tool"], "returncode": returncode}) + "\n")
+        protocol_out.flush()
+
+
+def _inputs_fingerprint(paths: Iterable[str]) -> str:
+    """Hash the path, mtime, size and bytes of every Python file under the given paths."""
+    digest = hashlib.blake2b()
+    for root in paths:
+        for path in sorted(Path(root).rglob("*.py")):
+            stat = path.stat()
+            digest.update(f"{path}:{stat.st_mtime_ns}:{stat.st_size}".encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _stage_fingerprint(inputs_fingerprint: str, tool_version: str) -> str:
+    """Combine the inputs fingerprint with the tool configuration files and the version of the stage's tool."""
+    digest = hashlib.blake2b(f"{inputs_fingerprint}:{tool_version}".encode())
+    for name in CHECK_CONFIG_FILES:
+        path = Path(name)
+        if path.is_file():
+            digest.update(name.encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _package_version(name: str) -> str:
+    """Get the installed version of a distribution, or an empty string if it is not installed."""
+    try:
+        return importlib.metadata.version(name)
+    except importlib.metadata.PackageNotFoundError:
+        return ""
+
+
+def _source_fingerprint() -> str:
+    """Hash the packaging metadata and every package source file (path + bytes)."""
+    digest = hashlib.blake2b()
+    sources = [Path(name) for name in ("pyproject.toml", "setup.py", "README.md")]
+    sources += sorted(Path("data_retrieval").rglob("*.py"))
+    for path in sources:
+        if path.is_file():
+            digest.update(str(path).encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _dist_up_to_date(fingerprint: str) -> bool:
+    """Check whether dist/ holds a wheel and an sdist built from the given fingerprint."""
+    if not DIST_FINGERPRINT_FILE.exists() or DIST_FINGERPRINT_FILE.read_text() != fingerprint:
+        return False
+    names = [path.name for path in _dist_files()]
+    return any(name.endswith(".whl") for name in names) and any(name.endswith(".tar.gz") for name in names)
+
+
+def _write_cache_file(path: Path, content: str) -> None:
+    """Atomically write a file under the build cache directory."""
+    BUILD_CACHE_DIR.mkdir(exist_ok=True)
+    tmp_file = path.with_name(path.name + ".tmp")
+    tmp_file.write_text(content)
+    os.replace(tmp_file, path)
+
+
+def _stage_cache_hit(stage: str, fingerprint: str) -> bool:
+    """Check whether the stage already passed for the given fingerprint."""
+    cache_file = BUILD_CACHE_DIR / f"{stage}.hash"
+    return cache_file.exists() and cache_file.read_text() == fingerprint
+
+
+def _store_stage_fingerprint(stage: str, fingerprint: str) -> None:
+    """Atomically record the fingerprint the stage last passed with."""
+    _write_cache_file(BUILD_CACHE_DIR / f"{stage}.hash", fingerprint)
+
+
+def clear_build_cache():
+    """Remove all cached pre-flight results."""
+    if BUILD_CACHE_DIR.exists():
+        print(f"Removing build cache: {BUILD_CACHE_DIR}")
+        shutil.rmtree(BUILD_CACHE_DIR)
+
+
+def _git_head() -> Optional[str]:
+    """Get the commit hash of HEAD, or None outside a git repository."""
+    result = run_command(["git", "rev-parse", "HEAD"], check=False, capture=True)
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+def _changed_python_files() -> Optional[Set[str]]:
+    """
+    List the package and test Python files, and tool configuration files, changed since pre-flight last passed.
+
+    :return: The changed paths, or None when there is no recorded passing commit.
+    """
+    if not PREFLIGHT_REF_FILE.exists():
+        return None
+    result = run_command(
+        ["git", "diff", "--name-only", "--diff-filter=ACMRD", PREFLIGHT_REF_FILE.read_text(), "HEAD"],
+        check=False,
+        capture=True,
+    )
+    if result.returncode != 0:
+        return None
+    return {
+        name for name in result.stdout.splitlines()
+        if (name.endswith(".py") and name.startswith(("data_retrieval/", "tests/"))) or name in CHECK_CONFIG_FILES
+    }
+
+
 def check_git_status():
     """Check if git working directory is clean."""
     print("Checking git status...")
-    result = run_command("git status --porcelain", check=False)
+    result = run_command(["git", "status", "--porcelain"], check=False, capture=True)
     if result.stdout.strip():
         print("❌ Working directory is not clean. Please commit or stash changes first.")
         return False
@@ -36,76 +278,159 @@ def check_git_status():
     return True
 
 
-def run_tests():
-    """Run the test suite."""
+def run_tests(fail_fast: bool = True):
+    """
+    Run the test suite.
+
+    Previously failing tests run first and, with fail_fast, the run stops at the
+    first failure. Tests are spread across all cores when pytest-xdist is installed.
+    """
     print("Running tests...")
+    fingerprint = _stage_fingerprint(_inputs_fingerprint(CHECK_INPUT_PATHS), _package_version("pytest"))
+    if _stage_cache_hit("tests", fingerprint):
+        print("✅ tests skipped (cache hit)")
+        return True
     try:
-        run_command("python -m pytest tests/ -v")
+        command = ["python", "-m", "pytest", "tests/", "-q", "--failed-first", "--last-failed-no-failures=all"]
+        if fail_fast:
+            command.append("-x")
+        if importlib.util.find_spec("xdist") is not None:
+            command += ["-n", "auto"]
+        run_command(command)
+        _store_stage_fingerprint("tests", fingerprint)
         print("✅ All tests passed")
         return True
-    except subprocess.CalledProcessError:
+    except (subprocess.CalledProcessError, FileNotFoundError):
         print("❌ Tests failed")
         return False
 
 
-def run_code_quality_checks():
-    """Run code quality checks."""
+def _quality_tool_versions() -> Optional[Dict[str, str]]:
+    """
+    Get the version of every quality tool, caching the version probe on disk.
+
+    The cache is keyed by each tool's executable path and mtime, so the probe only
+    runs again after a tool is installed, upgraded or removed.
+
+    :return: The version of each tool, or None if a tool is not installed.
+    """
+    keys = {}
+    for tool in QUALITY_TOOLS:
+        path = shutil.which(tool)
+        if path is None:
+            print(f"❌ {tool} is not installed. Install with: pip install {tool}")
+            return None
+        keys[tool] = f"{path}:{os.stat(path).st_mtime_ns}"
+
+    cache_file = BUILD_CACHE_DIR / "tool_versions.json"
+    cache = json.loads(cache_file.read_text()) if cache_file.exists() else {}
+    if all(key in cache for key in keys.values()):
+        return {tool: cache[key] for tool, key in keys.items()}
+
+    # Cache miss: import all tools in one interpreter to read their versions
+    result = run_command(["python", "-c", TOOL_VERSION_PROBE], check=False, capture=True)
+    if result.returncode == 0:
+        versions = result.stdout.split()
+    else:
+        # Tools installed outside this interpreter (e.g. with pipx) report their own version
+        versions = []
+        for tool in QUALITY_TOOLS:
+            result = run_command([tool, "--version"], check=False, capture=True)
+            if result.returncode != 0:
+                print(f"❌ {tool} is not working. Install with: pip install {tool}")
+                return None
+            versions.append(result.stdout.strip())
+    cache.update(zip((keys[tool] for tool in QUALITY_TOOLS), versions))
+    _write_cache_file(cache_file, json.dumps(cache, indent=2))
+    return dict(zip(QUALITY_TOOLS, versions))
+
+
+async def run_code_quality_checks():
+    """Run code quality checks concurrently."""
     print("Running code quality checks...")
     
     # Check if required tools are installed
-    tools = ["black", "isort", "mypy", "flake8"]
-    for tool in tools:
-        try:
-            run_command(f"{tool} --version", check=False)
-        except subprocess.CalledProcessError:
-            print(f"❌ {tool} is not installed. Install with: pip install {tool}")
-            return False
-    
-    # Run formatting checks
-    try:
-        print("Checking code formatting with black...")
-        run_command("black --check data_retrieval/ tests/")
-        print("✅ Black formatting check passed")
-    except subprocess.CalledProcessError:
-        print("❌ Code formatting issues found. Run: black data_retrieval/ tests/")
-        return False
-    
-    try:
-        print("Checking import sorting with isort...")
-        run_command("isort --check-only data_retrieval/ tests/")
-        print("✅ Import sorting check passed")
-    except subprocess.CalledProcessError:
-        print("❌ Import sorting issues found. Run: isort data_retrieval/ tests/")
+    versions = _quality_tool_versions()
+    if versions is None:
         return False
     
-    # Run type checking (optional, might fail on some projects)
+    # The checks are independent of each other, so run them all at once. Each
+    # stage is keyed by its tool's version and configuration as well as the sources.
+    inputs_fingerprint = _inputs_fingerprint(CHECK_INPUT_PATHS)
+    fingerprints = {tool: _stage_fingerprint(inputs_fingerprint, version) for tool, version in versions.items()}
+    checks = []
+    for tool, argv, required in [
+        ("black", ["black", "--check", "data_retrieval/", "tests/"], True),
+        ("isort", ["isort", "--check-only", "data_retrieval/", "tests/"], True),
+        # Type checking is optional, might fail on some projects
+        ("mypy", ["mypy", "data_retrieval/"], False),
+        ("flake8", ["flake8", "data_retrieval/"], False),
+    ]:
+        if _stage_cache_hit(tool, fingerprints[tool]):
+            print(f"✅ {tool} skipped (cache hit)")
+        else:
+            checks.append((tool, argv, required))
+    # Tools this interpreter cannot import (e.g. installed with pipx) run from $PATH
+    workers = {
+        tool: QualityWorker()
+        for tool, _, _ in checks
+        if tool in WORKER_TOOLS and importlib.util.find_spec(tool) is not None
+    }
     try:
-        print("Running type checking with mypy...")
-        run_command("mypy data_retrieval/", check=False)
-        print("✅ Type checking passed")
-    except subprocess.CalledProcessError:
-        print("⚠️ Type checking failed (optional)")
+        results = await asyncio.gather(
+            *(
+                workers[tool].run(argv) if tool in workers else run_command_async(argv)
+                for tool, argv, _ in checks
+            ),
+            return_exceptions=True,
+        )
+    finally:
+        await asyncio.gather(*(worker.close() for worker in workers.values()))
+
+    passed = True
+    for (tool, argv, required), result in zip(checks, results):
+        if not isinstance(result, BaseException):
+            _store_stage_fingerprint(tool, fingerprints[tool])
+            print(f"✅ {tool} check passed")
+        elif required:
+            print(f"❌ {tool} check failed. Run: {' '.join(a for a in argv if not a.startswith('--'))}")
+            passed = False
+        else:
+            print(f"⚠️ {tool} check failed (optional)")
     
-    return True
+    return passed
 
 
 def clean_build_artifacts():
-    """Clean previous build artifacts."""
+    """
+    Clean previous build artifacts.
+
+    :return: True if dist/ is already up to date and the build can be skipped.
+    """
+    if _dist_up_to_date(_source_fingerprint()):
+        print("✅ dist/ up to date, skipping build")
+        return True
+
     print("Cleaning build artifacts...")
     
+    # Collect build directories in a single pass over the top-level directory
+    with os.scandir(".") as entries:
+        targets = [
+            entry for entry in entries
+            if entry.name in BUILD_ARTIFACT_NAMES or entry.name.endswith(".egg-info")
+        ]
+
     # Remove build directories
-    dirs_to_remove = ["build", "dist", "*.egg-info"]
-    for pattern in dirs_to_remove:
-        for path in Path(".").glob(pattern):
-            if path.is_dir():
-                print(f"Removing directory: {path}")
-                import shutil
-                shutil.rmtree(path)
-            else:
-                print(f"Removing file: {path}")
-                path.unlink()
+    for entry in targets:
+        if entry.is_dir(follow_symlinks=False):
+            print(f"Removing directory: {entry.path}")
+            shutil.rmtree(entry.path)
+        else:
+            print(f"Removing file: {entry.path}")
+            os.unlink(entry.path)
     
     print("✅ Build artifacts cleaned")
+    return False
 
 
 def build_package():
@@ -113,7 +438,9 @@ def build_package():
     print("Building package...")
     
     # Use python -m build for modern building
-    run_command("python -m build")
+    fingerprint = _source_fingerprint()
+    run_command(["python", "-m", "build"])
+    DIST_FINGERPRINT_FILE.write_text(fingerprint)
     
     print("✅ Package built successfully")
     return True
@@ -124,24 +451,78 @@ def check_package():
     print("Checking package with twine...")
     
     try:
-        run_command("twine check dist/*")
+        run_command(["twine", "check", *(str(path) for path in _dist_files())])
         print("✅ Package check passed")
         return True
-    except subprocess.CalledProcessError:
+    except (subprocess.CalledProcessError, FileNotFoundError):
         print("❌ Package check failed")
         return False
 
 
+def _dist_files() -> List[Path]:
+    """List the built wheel and sdist artifacts in dist/."""
+    dist_dir = Path("dist")
+    if not dist_dir.is_dir():
+        return []
+    return sorted(
+        path for path in dist_dir.iterdir()
+        if path.name.endswith(".whl") or path.name.endswith(".tar.gz")
+    )
+
+
+def _file_sha256(path: Path) -> str:
+    """Compute the SHA-256 digest of a file."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def upload_distributions(repository: str) -> bool:
+    """
+    Upload all pending artifacts in dist/ with a single twine invocation.
+
+    Artifacts whose SHA-256 was already uploaded to the repository are skipped,
+    and --skip-existing keeps retries after a partial failure idempotent.
+    """
+    uploaded_file = BUILD_CACHE_DIR / "uploaded.json"
+    uploaded = json.loads(uploaded_file.read_text()) if uploaded_file.exists() else {}
+    already_uploaded = uploaded.setdefault(repository, {})
+
+    pending = {}
+    for path in _dist_files():
+        sha256 = _file_sha256(path)
+        if sha256 in already_uploaded:
+            print(f"Skipping already uploaded file: {path}")
+        else:
+            pending[sha256] = path
+    if not pending:
+        print("✅ Nothing new to upload")
+        return True
+
+    # One twine call for every artifact: a single TLS handshake and auth round-trip
+    command = ["twine", "upload", "--skip-existing", "--non-interactive"]
+    if repository != "pypi":
+        command += ["--repository", repository]
+    command += [str(path) for path in pending.values()]
+    run_command(command)
+
+    already_uploaded.update({sha256: path.name for sha256, path in pending.items()})
+    _write_cache_file(uploaded_file, json.dumps(uploaded, indent=2))
+    return True
+
+
 def upload_to_test_pypi():
     """Upload package to Test PyPI."""
     print("Uploading to Test PyPI...")
     
     try:
-        run_command("twine upload --repository testpypi dist/*")
+        upload_distributions(repository="testpypi")
         print("✅ Uploaded to Test PyPI successfully")
         print("📦 Install with: pip install --index-url https://test.pypi.org/simple/ data-retrieval-module")
         return True
-    except subprocess.CalledProcessError:
+    except (subprocess.CalledProcessError, FileNotFoundError):
         print("❌ Upload to Test PyPI failed")
         return False
 
@@ -151,16 +532,16 @@ def upload_to_pypi():
     print("Uploading to PyPI...")
     
     try:
-        run_command("twine upload dist/*")
+        upload_distributions(repository="pypi")
         print("✅ Uploaded to PyPI successfully")
         print("📦 Install with: pip install data-retrieval-module")
         return True
-    except subprocess.CalledProcessError:
+    except (subprocess.CalledProcessError, FileNotFoundError):
         print("❌ Upload to PyPI failed")
         return False
 
 
-def main():
+async def main_async():
     """Main function."""
     print("🚀 Data Retrieval Module - Build and Publish Script")
     print("=" * 50)
@@ -171,32 +552,49 @@ def main():
         sys.exit(1)
     
     # Parse command line arguments
-    if len(sys.argv) < 2:
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    flags = {arg for arg in sys.argv[1:] if arg.startswith("--")}
+    if not args:
         print("Usage:")
         print("  python build_and_publish.py test      # Build and upload to Test PyPI")
         print("  python build_and_publish.py prod      # Build and upload to PyPI")
         print("  python build_and_publish.py build     # Build only")
         print("  python build_and_publish.py check     # Run checks only")
+        print("Options:")
+        print("  --no-cache    # Ignore cached pre-flight results")
+        print("  --force       # Run tests and checks even if no Python files changed")
         sys.exit(1)
     
-    command = sys.argv[1].lower()
+    command = args[0].lower()
+
+    if "--no-cache" in flags:
+        clear_build_cache()
     
     # Pre-flight checks
     if not check_git_status():
         sys.exit(1)
     
-    if not run_tests():
-        sys.exit(1)
-    
-    if not run_code_quality_checks():
-        print("⚠️ Code quality issues found. Continue anyway? (y/N)")
-        if input().lower() != 'y':
+    head = _git_head()
+    changed_files = _changed_python_files() if "--force" not in flags else None
+    if changed_files is not None and not changed_files:
+        print("✅ no python changes; skipping tests & lint")
+    else:
+        # Release uploads always run the full suite rather than stopping at the first failure
+        if not run_tests(fail_fast=command != "prod"):
             sys.exit(1)
+
+        if await run_code_quality_checks():
+            if head is not None:
+                _write_cache_file(PREFLIGHT_REF_FILE, head)
+        else:
+            print("⚠️ Code quality issues found. Continue anyway? (y/N)")
+            if input().lower() != 'y':
+                sys.exit(1)
     
     # Clean and build
-    clean_build_artifacts()
+    dist_up_to_date = clean_build_artifacts()
     
-    if not build_package():
+    if not dist_up_to_date and not build_package():
         sys.exit(1)
     
     if not check_package():
@@ -216,5 +614,13 @@ def main():
         sys.exit(1)
 
 
+def main():
+    """Entry point."""
+    asyncio.run(main_async())
+
+
 if __name__ == "__main__":
-    main()
+    if "--worker" in sys.argv:
+        _run_worker()
+    else:
+        main()
@@ -8,37 +8,93 @@
 #######################################################################
 
 #######################################################################
-# Import Core Classes
+# Import Packages
 #######################################################################
-from data_retrieval.model.data_provider import DataProvider
-from data_retrieval.model.data_module import DataModule
-from data_retrieval.model.exceptions import (
-    DataProviderError,
-    DataProviderConnectionError,
-    DataFetchError,
-    DataMethodNotFoundError,
-    ReturnDataTypeNotMatchedError,
-    ValidationError
-)
+# Standard Packages
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from data_retrieval.model.data_provider import DataProvider
+    from data_retrieval.model.data_module import DataModule
+    from data_retrieval.model.connection_pool import ConnectionPool
+    from data_retrieval.model.exceptions import (
+        ErrorCode,
+        DataProviderError,
+        DataProviderConnectionError,
+        DataFetchError,
+        DataMethodNotFoundError,
+        ReturnDataTypeNotMatchedError,
+        ValidationError
+    )
+    from data_retrieval.data_provider.rest_api import RestAPI_DataProvider
+    from data_retrieval.data_provider.database import (
+        Database_DataProvider,
+        SQLite3_DataProvider,
+    )
+    from data_retrieval.foreign_exchange import (
+        Forex_DataProvider_Base,
+        ForexPython_DataProvider,
+        Forex_DataProvider_Wrapper,
+    )
 
 #######################################################################
-# Import Data Provider Implementations
+# Lazy Imports
 #######################################################################
-# REST API providers
-from data_retrieval.data_provider.rest_api import RestAPI_DataProvider
+# Public names mapped to the module defining them. Modules are only imported
+# on first attribute access, so `import data_retrieval` does not pull in
+# requests, sqlite3 or forex-python until a provider is actually used.
+_LAZY_IMPORTS = {
+    # Core classes
+    "DataProvider": "data_retrieval.model.data_provider",
+    "DataModule": "data_retrieval.model.data_module",
+    "ConnectionPool": "data_retrieval.model.connection_pool",
+
+    # Exceptions
+    "ErrorCode": "data_retrieval.model.exceptions",
+    "DataProviderError": "data_retrieval.model.exceptions",
+    "DataProviderConnectionError": "data_retrieval.model.exceptions",
+    "DataFetchError": "data_retrieval.model.exceptions",
+    "DataMethodNotFoundError": "data_retrieval.model.exceptions",
+    "ReturnDataTypeNotMatchedError": "data_retrieval.model.exceptions",
+    "ValidationError": "data_retrieval.model.exceptions",
+
+    # REST API providers
+    "RestAPI_DataProvider": "data_retrieval.data_provider.rest_api",
+
+    # Database providers
+    "Database_DataProvider": "data_retrieval.data_provider.database",
+    "SQLite3_DataProvider": "data_retrieval.data_provider.database",
+
+    # Foreign Exchange providers
+    "Forex_DataProvider_Base": "data_retrieval.foreign_exchange",
+    "ForexPython_DataProvider": "data_retrieval.foreign_exchange",
+    "Forex_DataProvider_Wrapper": "data_retrieval.foreign_exchange",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import a public name on first access and cache it in the module globals.
+
+    :param name: The attribute name being looked up.
+    :return: The requested class.
+    :raises AttributeError: If the name is not part of the public API.
+    """
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
+
 
-# Database providers
-from data_retrieval.data_provider.database import (
-    Database_DataProvider,
-    SQLite3_DataProvider,
-)
+def __dir__() -> List[str]:
+    """
+    List the module attributes, including the not-yet-imported public names.
+    """
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
-# Foreign Exchange providers
-from data_retrieval.foreign_exchange import (
-    Forex_DataProvider_Base,
-    ForexPython_DataProvider,
-    Forex_DataProvider_Wrapper,
-)
 
 #######################################################################
 # Public API
@@ -47,8 +103,10 @@ __all__ = [
     # Core classes
     "DataProvider",
     "DataModule",
+    "ConnectionPool",
     
     # Exceptions
+    "ErrorCode",
     "DataProviderError",
     "DataProviderConnectionError",
     "DataFetchError",
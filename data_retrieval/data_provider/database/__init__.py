@@ -1,4 +1,33 @@
-from .database_data_provider import Database_DataProvider
-from .sqlite3_data_provider import SQLite3_DataProvider
+#######################################################################
+# Project: Data Retrieval Module
+# File: __init__.py
+# Description: Database data provider package initialization
+#######################################################################
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .database_data_provider import Database_DataProvider
+    from .sqlite3_data_provider import SQLite3_DataProvider
+
+# Public names mapped to the submodule defining them, imported on first access
+_LAZY_IMPORTS = {
+    "Database_DataProvider": ".database_data_provider",
+    "SQLite3_DataProvider": ".sqlite3_data_provider",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __all__ = ["Database_DataProvider", "SQLite3_DataProvider"]
@@ -13,12 +13,17 @@
 # Standard Packages
 import datetime
 import logging
+import random
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from contextlib import contextmanager
+from typing import Any, ClassVar, Dict, Iterator, List, Optional, Tuple, Type
 
 # Third-party Packages
 
 # Local Packages
+from data_retrieval.model.connection_pool import ConnectionPool
 from data_retrieval.model.data_provider import DataProvider
 
 
@@ -38,9 +43,17 @@ class Database_DataProvider(DataProvider, ABC):
     ###################################################################
     # Class Attributes
     ###################################################################
-    __name = "Database_DataProvider"
-    __type = "Database_DataProvider"
-        
+    name: ClassVar[str] = "Database_DataProvider"
+    type: ClassVar[str] = "Database_DataProvider"
+
+    # Exceptions raised by the database driver, caught on the query paths
+    DRIVER_EXCEPTIONS: Tuple[Type[Exception], ...] = (Exception,)
+
+    # Whether the provider implements _create_connection() for connection pooling
+    SUPPORTS_CONNECTION_POOL: ClassVar[bool] = False
+
+    __slots__ = ("_pinned", "_health_cache", "_health_lock", "_connection_pool")
+
     ###################################################################
     # Constructor Method
     ###################################################################
@@ -67,6 +80,236 @@ class Database_DataProvider(DataProvider, ABC):
             **config    
         )
 
+        # Connection pinned to the current thread by transaction()
+        self._pinned = threading.local()
+
+        # Last health_check() outcome as (monotonic expiry time, result)
+        self._health_cache = (0.0, False)
+        self._health_lock = threading.Lock()
+
+        # Shared connection pool, opened on connect when "max_connections" is configured
+        self._connection_pool: Optional[ConnectionPool] = None
+
+    ###################################################################
+    # Connection Management Methods
+    ###################################################################
+    def is_connected(self) -> bool:
+        """
+        Check if the provider is connected to the database.
+
+        A provider using a connection pool holds no connection of its own, so it
+        is connected as long as its pool is open.
+
+        :return: True if connected, False otherwise.
+        """
+        return self._connection_pool is not None or super().is_connected()
+
+    @contextmanager
+    def acquire_connection(self) -> Iterator[Any]:
+        """
+        Acquire a connection for a single database operation.
+
+        Inside a transaction() block the connection pinned to the current thread is
+        returned, so every statement of the block runs on the same connection.
+
+        :return: Iterator yielding the connection to use.
+        """
+        pinned = getattr(self._pinned, "connection", None)
+        if pinned is not None:
+            yield pinned
+            return
+        with self._acquire_connection() as connection:
+            yield connection
+
+    @contextmanager
+    def _acquire_connection(self) -> Iterator[Any]:
+        """
+        Acquire a connection outside of a transaction.
+
+        A connection is borrowed from the connection pool when one is open, and
+        otherwise the single provider connection is shared. Subclasses override
+        this to hand out connections differently.
+
+        :return: Iterator yielding the connection to use.
+        """
+        pool = self._connection_pool
+        if pool is None:
+            yield self.get_connection()
+            return
+        with pool.connection(timeout=self.get_config().get("connection_timeout")) as connection:
+            yield connection
+
+    def get_connection_pool(self) -> Optional[ConnectionPool]:
+        """
+        Get the connection pool used by the provider.
+
+        :return: The connection pool, or None if pooling is disabled.
+        """
+        return self._connection_pool
+
+    def _open_connection_pool(self) -> Optional[ConnectionPool]:
+        """
+        Open the connection pool configured by the "max_connections" config entry.
+
+        Providers of the same class with the same connection settings share one
+        pool, so the number of open connections stays bounded however many
+        providers exist. "min_connections" idle connections are kept open, and the
+        others are closed after "connection_idle_timeout" seconds (default 300).
+
+        :return: The shared connection pool, or None if pooling is disabled or unsupported.
+        """
+        config = self.get_config()
+        max_connections = config.get("max_connections") or 0
+        if max_connections <= 0:
+            return None
+        if not self.SUPPORTS_CONNECTION_POOL:
+            self.logger.warning("%s does not support connection pooling; ignoring max_connections.", type(self).__name__)
+            return None
+        return ConnectionPool.shared(
+            (type(self), self._pool_key()),
+            self._create_connection,
+            min_size=config.get("min_connections", 0),
+            max_size=max_connections,
+            idle_timeout=config.get("connection_idle_timeout", 300.0),
+        )
+
+    def _create_connection(self) -> Any:
+        """
+        Open a new database connection for the connection pool.
+
+        Only called when SUPPORTS_CONNECTION_POOL is set; providers setting it
+        override this method.
+
+        :return: The new connection.
+        """
+        ...
+
+    def _pool_key(self) -> Any:
+        """
+        Get a hashable key identifying the connection settings, so that providers
+        connecting to the same database share a pool.
+
+        :return: The pool key.
+        """
+        return repr(sorted(self.get_config().items()))
+
+    def _begin(self, connection: Any) -> None:
+        """
+        Start a transaction on the given connection.
+
+        Drivers that open transactions implicitly need nothing here; subclasses
+        override it when an explicit BEGIN is required.
+
+        :param connection: The connection pinned for the transaction.
+        :return: None.
+        """
+        pass
+
+    def _commit(self, connection: Any) -> None:
+        """
+        Commit the transaction of a successful transaction() block.
+
+        Subclasses override it to act once the transaction's writes are visible.
+
+        :param connection: The connection pinned for the transaction.
+        :return: None.
+        """
+        connection.commit()
+
+    def _rollback(self, connection: Any) -> None:
+        """
+        Roll back the transaction of a failed transaction() block.
+
+        Subclasses override it to skip the round-trip when nothing is pending.
+
+        :param connection: The connection pinned for the transaction.
+        :return: None.
+        """
+        connection.rollback()
+
+    def in_transaction(self) -> bool:
+        """
+        Check if the current thread is inside a transaction() block.
+
+        :return: True if a connection is pinned to the current thread, False otherwise.
+        """
+        return getattr(self._pinned, "connection", None) is not None
+
+    @contextmanager
+    def transaction(self) -> Iterator[Any]:
+        """
+        Run a block of statements in a single transaction.
+
+        The acquired connection is pinned to the current thread for the duration of
+        the block. It is committed on success and rolled back if the block raises.
+        Nested calls join the outer transaction.
+
+        :return: Iterator yielding the connection pinned for the block.
+        """
+        if self.in_transaction():
+            yield self._pinned.connection
+            return
+
+        with self._acquire_connection() as connection:
+            self._pinned.connection = connection
+            try:
+                self._begin(connection)
+                yield connection
+                self._commit(connection)
+            except BaseException:
+                self._rollback(connection)
+                raise
+            finally:
+                self._pinned.connection = None
+
+    ###################################################################
+    # Health Check Methods
+    ###################################################################
+    def health_check(self) -> bool:
+        """
+        Check that the database answers queries.
+
+        A successful check is reused for "health_ttl" seconds (default 5), with
+        +/-10% jitter so that replicas do not probe in lockstep. Failures are not
+        cached, so recovery is noticed on the next call. Concurrent callers wait
+        for a single probe instead of each sending their own.
+
+        :return: True if the database is reachable, False otherwise.
+        """
+        expires_at, healthy = self._health_cache
+        if healthy and time.monotonic() < expires_at and self.is_connected():
+            return True
+
+        with self._health_lock:
+            expires_at, healthy = self._health_cache
+            if healthy and time.monotonic() < expires_at and self.is_connected():
+                return True
+
+            try:
+                healthy = self.is_connected() and self._ping()
+            except self.DRIVER_EXCEPTIONS as e:
+                self.logger.warning("Health check failed: %s", e)
+                healthy = False
+
+            ttl = self.get_config().get("health_ttl", 5.0) * random.uniform(0.9, 1.1)
+            self._health_cache = (time.monotonic() + ttl, healthy)
+            return healthy
+
+    def _ping(self) -> bool:
+        """
+        Run a trivial query on the database.
+
+        :return: True if the query succeeded.
+        """
+        with self.acquire_connection() as connection:
+            cursor = connection.cursor()
+            try:
+                cursor.execute("SELECT 1")
+                cursor.fetchone()
+            finally:
+                cursor.close()
+        return True
+
     ###################################################################
     # Utility Methods
     ###################################################################
@@ -98,6 +341,26 @@ class Database_DataProvider(DataProvider, ABC):
 
         return sql
 
+    @staticmethod
+    def rows_to_dicts(rows: List[Any], description: Optional[Any] = None) -> List[Dict[str, Any]]:
+        """
+        Convert fetched rows into dictionaries keyed by column name.
+
+        Rows that already behave like mappings (e.g. sqlite3.Row) are converted
+        directly; plain tuples are zipped with the column names taken once from the
+        cursor description.
+
+        :param rows: List of rows returned by the cursor.
+        :param description: The cursor description, required for tuple rows.
+        :return: List of dictionaries, one per row.
+        """
+        if not rows:
+            return []
+        if hasattr(rows[0], "keys"):
+            return list(map(dict, rows))
+        columns = [column[0] for column in description or ()]
+        return [dict(zip(columns, row)) for row in rows]
+
     @staticmethod
     def stringify_a_list_of_items_with_apostrophe(item_list: List[Any]) -> str:
         """
@@ -12,15 +12,89 @@
 # Import Libraries
 ########################################################################
 # Standard Packages
+import asyncio
+import functools
 import logging
+import operator
+import re
 import sqlite3
+import threading
+import weakref
+from collections import deque
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, ClassVar, Dict, Hashable, Iterator, List, Optional, Tuple, Union
 
 # Third-party Packages
 from data_retrieval.data_provider.database.database_data_provider import (
     Database_DataProvider,
 )
+from data_retrieval.utils.cache_utils import TTLCache
+
+
+########################################################################
+# Constants
+########################################################################
+# Size of the per-connection prepared statement cache, overridable via the
+# "cached_statements" config entry
+DEFAULT_CACHED_STATEMENTS = 256
+
+# Number of worker threads used by fetch_parallel, overridable via the
+# "pool_size" config entry
+DEFAULT_POOL_SIZE = 4
+
+# Number of buffered writes that triggers a flush, overridable via the
+# "write_buffer_size" config entry
+DEFAULT_WRITE_BUFFER_SIZE = 500
+
+# Locking mode of the transactions opened by transaction() and execute_many,
+# overridable via the "transaction_mode" config entry (DEFERRED, IMMEDIATE or
+# EXCLUSIVE). IMMEDIATE takes the write lock up front, so concurrent writers
+# wait on busy_timeout instead of failing to upgrade a read lock mid-transaction.
+DEFAULT_TRANSACTION_MODE = "IMMEDIATE"
+
+# Maximum number of bound parameters per statement on older SQLite builds
+SQLITE_MAX_VARIABLES = 999
+
+# SELECT queries, and any LIMIT clause, for the fetch_mode="many" rewrite
+_SELECT_PATTERN = re.compile(r"^\s*(?:SELECT|WITH)\b", re.IGNORECASE)
+_LIMIT_PATTERN = re.compile(r"\blimit\b", re.IGNORECASE)
+
+# Read-only statements, which never need a rollback when they fail
+_READ_ONLY_PATTERN = re.compile(r"^\s*(?:SELECT|WITH|EXPLAIN)\b", re.IGNORECASE)
+
+# Parentheses, string literals and statement verbs, to find the main verb of a
+# WITH statement after its common table expressions
+_CTE_TOKEN_PATTERN = re.compile(r"'(?:[^']|'')*'|[()]|\b(?:SELECT|INSERT|UPDATE|DELETE|REPLACE)\b", re.IGNORECASE)
+
+# Tables read by a SELECT and written by a DML/DDL statement, used to
+# invalidate cached query results
+_READ_TABLES_PATTERN = re.compile(r"\b(?:FROM|JOIN)\s+[\"`\[]?(\w+)", re.IGNORECASE)
+_WRITE_TABLES_PATTERN = re.compile(r"\b(?:INTO|UPDATE|FROM|TABLE)\s+(?:IF\s+(?:NOT\s+)?EXISTS\s+)?[\"`\[]?(\w+)", re.IGNORECASE)
+_FOR_UPDATE_PATTERN = re.compile(r"\bFOR\s+UPDATE\b", re.IGNORECASE)
+
+# Plain "INSERT INTO t (cols) VALUES (?, ...)" statements, which execute_many
+# rewrites into multi-row VALUES pages
+_INSERT_VALUES_PATTERN = re.compile(
+    r"^\s*(INSERT\s+(?:OR\s+\w+\s+)?INTO\s+[^(]+?\s*\([^)]*\)\s*VALUES)\s*(\([^()]*\))\s*;?\s*$",
+    re.IGNORECASE,
+)
+
+# Numbered or named placeholders (?1, :name, @name, $name), which bind by
+# position or name and so cannot be repeated across the rows of one statement
+_NON_BARE_PLACEHOLDER_PATTERN = re.compile(r"\?\d|[:@$]\w")
+
+# PRAGMAs applied to every new connection, overridable via the
+# "sqlite_pragmas" config entry
+DEFAULT_SQLITE_PRAGMAS: Dict[str, Any] = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "temp_store": "MEMORY",
+    "cache_size": -64000,
+    "mmap_size": 268435456,
+}
 
 
 ########################################################################
@@ -37,6 +111,171 @@ class SQLite3FetchMode(str, Enum):
     NONE = "none"
 
 
+def _to_rows(cursor: sqlite3.Cursor, rows: List[sqlite3.Row], as_dict: bool) -> List[Any]:
+    """
+    Return fetched rows, converted to dictionaries if requested.
+
+    :param cursor: The cursor the rows were fetched from.
+    :param rows: The fetched rows.
+    :param as_dict: Whether to convert the rows to dictionaries.
+    :return: The rows.
+    """
+    return Database_DataProvider.rows_to_dicts(rows, cursor.description) if as_dict else rows
+
+
+def _is_cte_write(sql: str) -> bool:
+    """
+    Check if a WITH statement writes, i.e. its main verb after the common table expressions is not SELECT.
+
+    :param sql: The SQL statement.
+    :return: True if the statement is a WITH ... INSERT/UPDATE/DELETE/REPLACE, False otherwise.
+    """
+    if sql.lstrip()[:4].upper() != "WITH":
+        return False
+    depth = 0
+    for match in _CTE_TOKEN_PATTERN.finditer(sql):
+        token = match.group()
+        if token == "(":
+            depth += 1
+        elif token == ")":
+            depth -= 1
+        elif depth == 0 and token[0] != "'":
+            return token.upper() != "SELECT"
+    return False
+
+
+@functools.lru_cache(maxsize=DEFAULT_CACHED_STATEMENTS)
+def _statement_info(sql: str) -> Tuple[bool, bool, bool, frozenset, frozenset]:
+    """
+    Classify a SQL statement once per distinct SQL text.
+
+    WITH statements are classified by their main verb, so a WITH ... INSERT is a write.
+
+    :param sql: The SQL statement.
+    :return: Tuple of (is a SELECT, is read-only, locks rows FOR UPDATE, tables read, tables written).
+    """
+    cte_write = _is_cte_write(sql)
+    return (
+        _SELECT_PATTERN.match(sql) is not None and not cte_write,
+        _READ_ONLY_PATTERN.match(sql) is not None and not cte_write,
+        _FOR_UPDATE_PATTERN.search(sql) is not None,
+        frozenset(name.lower() for name in _READ_TABLES_PATTERN.findall(sql)),
+        frozenset(name.lower() for name in _WRITE_TABLES_PATTERN.findall(sql)),
+    )
+
+
+def _to_row(row: Optional[sqlite3.Row], as_dict: bool) -> Any:
+    """
+    Return a fetched row, converted to a dictionary if requested.
+
+    :param row: The fetched row, or None.
+    :param as_dict: Whether to convert the row to a dictionary.
+    :return: The row.
+    """
+    return dict(row) if as_dict and row is not None else row
+
+
+def _copy_result(result: Any) -> Any:
+    """
+    Copy a query result so that callers cannot change a cached one.
+
+    sqlite3.Row objects are immutable and shared as-is; dictionary rows are copied.
+
+    :param result: The fetched row or list of rows.
+    :return: The copied result.
+    """
+    if isinstance(result, list):
+        return [dict(row) if isinstance(row, dict) else row for row in result]
+    return dict(result) if isinstance(result, dict) else result
+
+
+class _ThreadConnection:
+    """
+    Connection opened by a worker thread, kept in that thread's thread-local storage.
+
+    The connection is closed once the thread exits and its thread-local storage
+    releases the holder, or earlier by close().
+    """
+
+    __slots__ = ("connection", "close", "__weakref__")
+
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        """
+        Initialize the holder.
+
+        :param connection: The connection of the thread.
+        """
+        self.connection = connection
+        self.close = weakref.finalize(self, connection.close)
+
+
+class SQLite3_PreparedStatement:
+    """
+    Handle binding a SQL statement to a provider, to execute it with many parameter sets.
+
+    This is a thin alias of SQLite3_DataProvider.execute() and execute_many(),
+    with the same defaults. sqlite3 already reuses the compiled statement from
+    each connection's statement cache, keyed by the SQL text, so executing the
+    same SQL through the provider directly costs the same.
+    """
+
+    __slots__ = ("_provider", "_sql")
+
+    def __init__(self, provider: "SQLite3_DataProvider", sql: str) -> None:
+        """
+        Initialize the handle.
+
+        :param provider: The provider executing the statement.
+        :param sql: The SQL statement.
+        """
+        self._provider = provider
+        self._sql = sql
+
+    def get_sql(self) -> str:
+        """
+        Get the SQL statement.
+
+        :return: The SQL statement.
+        """
+        return self._sql
+
+    def execute(
+        self,
+        params: Optional[Union[Tuple, Dict[str, Any]]] = None,
+        fetch_mode: str = SQLite3FetchMode.ALL,
+        commit: bool = True,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Execute the statement with one parameter set, as SQLite3_DataProvider.execute() does.
+
+        :param params: Parameters of the statement.
+        :param fetch_mode: Fetch mode, see SQLite3_DataProvider.execute().
+        :param commit: Whether to commit after execution, unless inside a transaction() block.
+        :param kwargs: Additional keyword arguments passed to SQLite3_DataProvider.execute().
+        :return: Query results based on fetch mode.
+        """
+        return self._provider.execute(self._sql, params, fetch_mode=fetch_mode, commit=commit, **kwargs)
+
+    def execute_many(
+        self,
+        params_list: List[Union[Tuple, Dict[str, Any]]],
+        fetch_mode: str = SQLite3FetchMode.ALL,
+        commit: bool = True,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Execute the statement with many parameter sets, as SQLite3_DataProvider.execute_many() does.
+
+        :param params_list: List of parameter tuples or dicts.
+        :param fetch_mode: Fetch mode, see SQLite3_DataProvider.execute_many().
+        :param commit: Whether to commit after execution, unless inside a transaction() block.
+        :param kwargs: Additional keyword arguments passed to SQLite3_DataProvider.execute_many().
+        :return: Query results based on fetch mode.
+        """
+        return self._provider.execute_many(self._sql, params_list, fetch_mode=fetch_mode, commit=commit, **kwargs)
+
+
 class SQLite3_DataProvider(Database_DataProvider):
     """
     SQLite3 data provider class.
@@ -45,7 +284,41 @@ class SQLite3_DataProvider(Database_DataProvider):
     ###################################################################
     # Class Attributes
     ###################################################################
-    __name = "SQLite3_DataProvider"
+    name: ClassVar[str] = "SQLite3_DataProvider"
+
+    # Exceptions raised by the sqlite3 driver
+    DRIVER_EXCEPTIONS = (sqlite3.Error,)
+
+    # File databases can share a pool of connections opened by _create_connection()
+    SUPPORTS_CONNECTION_POOL = True
+
+    # Result readers per fetch mode, each called as handler(cursor, as_dict, kwargs)
+    _FETCH_HANDLERS: Dict[str, Callable[[sqlite3.Cursor, bool, Dict[str, Any]], Any]] = {
+        SQLite3FetchMode.ALL: lambda cursor, as_dict, kwargs: _to_rows(cursor, cursor.fetchall(), as_dict),
+        SQLite3FetchMode.ONE: lambda cursor, as_dict, kwargs: _to_row(cursor.fetchone(), as_dict),
+        SQLite3FetchMode.MANY: lambda cursor, as_dict, kwargs: _to_rows(
+            cursor, cursor.fetchmany(kwargs.get("fetch_size", 100)), as_dict
+        ),
+        SQLite3FetchMode.LAST_ID: lambda cursor, as_dict, kwargs: cursor.lastrowid,
+        SQLite3FetchMode.NONE: lambda cursor, as_dict, kwargs: None,
+    }
+
+    __slots__ = (
+        "_db_file_path",
+        "_memory_db",
+        "_cursor",
+        "_connection_params",
+        "_thread_local",
+        "_thread_connections",
+        "_thread_connections_lock",
+        "_shared_connection_lock",
+        "_query_cache",
+        "_uncommitted_writes",
+        "_write_buffer",
+        "_write_buffer_count",
+        "_write_buffer_lock",
+        "_flush_timer",
+    )
 
     ###################################################################
     # Constructor Method
@@ -78,8 +351,33 @@ class SQLite3_DataProvider(Database_DataProvider):
         # Initialize the DatabaseService attributes
         ## Store the database path
         self._db_file_path = db_file_path
+        self._memory_db = self._is_memory_path(db_file_path)
         ## Initialize the cursor
         self._cursor: Optional[sqlite3.Cursor] = None
+        ## sqlite3.connect() arguments and PRAGMA statements, built on connect
+        self._connection_params: Optional[Tuple[Dict[str, Any], Tuple[str, ...]]] = None
+        ## Connection of each thread, kept in thread-local storage and closed when
+        ## the thread exits. An in-memory database only exists within its
+        ## connection, so it is shared by all threads behind a lock.
+        self._thread_local = threading.local()
+        self._thread_connections: "weakref.WeakSet[_ThreadConnection]" = weakref.WeakSet()
+        self._thread_connections_lock = threading.Lock()
+        self._shared_connection_lock = threading.RLock()
+        ## Cache of read-only query results, enabled by a positive "cache_ttl" config entry
+        cache_ttl = self.get_config().get("cache_ttl") or 0
+        self._query_cache: Optional[TTLCache] = (
+            TTLCache(maxsize=self.get_config().get("cache_maxsize", 1024), ttl=cache_ttl)
+            if cache_ttl > 0
+            else None
+        )
+        ## Write statements of the current thread not committed yet, whose cached
+        ## reads are dropped again on commit
+        self._uncommitted_writes = threading.local()
+        ## Writes queued by buffer_write, as {sql: {key: params}} in arrival order
+        self._write_buffer: Dict[str, Dict[Hashable, Union[Tuple, Dict[str, Any]]]] = {}
+        self._write_buffer_count = 0
+        self._write_buffer_lock = threading.RLock()
+        self._flush_timer: Optional[threading.Timer] = None
         ## Connect to the datbase file
         self.connect()
 
@@ -91,6 +389,12 @@ class SQLite3_DataProvider(Database_DataProvider):
                 "fetch_one": self.fetch_one,
                 "fetch_many": self.fetch_many,
                 "fetch_all": self.fetch_all,
+                "iterate": self.iterate,
+                "fetch_by_keys": self.fetch_by_keys,
+                "fetch_parallel": self.fetch_parallel,
+                "fetch_paginated": self.fetch_paginated,
+                "buffer_write": self.buffer_write,
+                "bulk_insert": self.bulk_insert,
             }
         )
     
@@ -113,6 +417,7 @@ class SQLite3_DataProvider(Database_DataProvider):
         :return: None.
         """
         self._db_file_path = db_file_path
+        self._memory_db = self._is_memory_path(db_file_path)
 
     def get_cursor(self) -> Optional[sqlite3.Cursor]:
         """
@@ -131,31 +436,210 @@ class SQLite3_DataProvider(Database_DataProvider):
         """
         self._cursor = cursor
 
+    def is_memory_db(self) -> bool:
+        """
+        Check if the provider points at an in-memory database.
+
+        The answer is computed once whenever the database path is set, since it is
+        consulted on every connection acquisition.
+
+        :return: True if the database lives in memory, False otherwise.
+        """
+        return self._memory_db
+
+    @staticmethod
+    def _is_memory_path(db_file_path: str) -> bool:
+        """
+        Check if a database path refers to an in-memory database.
+
+        :param db_file_path: The path to the SQLite database file.
+        :return: True if the path refers to an in-memory database, False otherwise.
+        """
+        return db_file_path == ":memory:" or "mode=memory" in db_file_path
+
+    def get_pragmas(self) -> Dict[str, Any]:
+        """
+        Get the PRAGMAs applied to every new connection.
+
+        The defaults favour concurrent access (WAL journal, NORMAL synchronous,
+        in-memory temp store, larger page cache and mmap). They are updated with
+        the "sqlite_pragmas" config entry, and foreign key enforcement is turned on
+        when the "foreign_keys" config entry is truthy.
+
+        :return: Dictionary mapping PRAGMA names to values.
+        """
+        config = self.get_config()
+        pragmas = dict(DEFAULT_SQLITE_PRAGMAS)
+        pragmas.update(config.get("sqlite_pragmas") or {})
+        if config.get("foreign_keys"):
+            pragmas["foreign_keys"] = "ON"
+        return pragmas
+
     ###################################################################
     # Connection Methods
     ###################################################################
+    def _create_connection(self) -> sqlite3.Connection:
+        """
+        Open a new connection to the SQLite database.
+
+        Connections are created with check_same_thread disabled since the provider
+        itself guarantees that a connection is only used by one thread at a time.
+        sqlite3 keeps an LRU of prepared statements keyed by SQL text per connection;
+        its size is raised to reuse query plans across repeated calls. Setting the
+        "autocommit" config entry opens the connection in autocommit mode.
+
+        :return: The new SQLite connection.
+        :raises sqlite3.Error: If connection fails.
+        """
+        # Connect to the database
+        if self._connection_params is None:
+            self._connection_params = self._build_connection_params()
+        connect_kwargs, pragma_statements = self._connection_params
+        conn: sqlite3.Connection = sqlite3.connect(**connect_kwargs)
+
+        # Set row factory to return rows as sqlite3.Row objects
+        conn.row_factory = sqlite3.Row
+
+        # Apply the connection PRAGMAs
+        for statement in pragma_statements:
+            conn.execute(statement)
+        return conn
+
+    def _pool_key(self) -> str:
+        """
+        Get the key of the connection pool shared by providers with the same connection settings.
+
+        :return: The pool key.
+        """
+        return repr(self._connection_params)
+
+    def _build_connection_params(self) -> Tuple[Dict[str, Any], Tuple[str, ...]]:
+        """
+        Build the sqlite3.connect() arguments and PRAGMA statements for new connections.
+
+        The result is cached by _connect() so that connections opened later by
+        other threads skip re-reading the configuration.
+
+        :return: Tuple of (connect keyword arguments, PRAGMA statements).
+        """
+        config = self.get_config()
+        connect_kwargs = {
+            "database": self.get_db_file_path(),
+            "check_same_thread": False,
+            "isolation_level": None if config.get("autocommit") else "",
+            "cached_statements": config.get("cached_statements", DEFAULT_CACHED_STATEMENTS),
+        }
+        pragma_statements = tuple(f"PRAGMA {pragma}={value}" for pragma, value in self.get_pragmas().items())
+        return connect_kwargs, pragma_statements
+
     def _connect(self, *args, **kwargs) -> None:
         """
         Connect to the SQLite database.
 
         Creates a connection to the SQLite database file specified by db_file_path.
-        If the file does not exist, SQLite will create it.
+        If the file does not exist, SQLite will create it. The connection is used
+        by the connecting thread; other threads open their own on first use. When
+        a connection pool is configured, the first pooled connection is opened
+        instead and returned to the pool, so no connection exists outside of it;
+        the provider then holds no connection or cursor of its own.
 
         :param args: Positional arguments (unused).
         :param kwargs: Keyword arguments (unused).
         :return: None.
         :raises sqlite3.Error: If connection fails.
         """
-        # Connect to the database
-        conn = sqlite3.connect(self.get_db_file_path())
-        
-        # Set row factory to return rows as sqlite3.Row objects
-        conn.row_factory = sqlite3.Row
-        
+        # Connect to the database with freshly built connection parameters
+        self._connection_params = self._build_connection_params()
+
+        # Share a bounded pool of connections instead of opening one per thread,
+        # unless the database lives in memory and only exists within its connection
+        pool = None if self._memory_db else self._open_connection_pool()
+        self._connection_pool = pool
+        if pool is not None:
+            with pool.connection(timeout=self.get_config().get("connection_timeout")):
+                return
+
+        conn = self._create_connection()
+        self._thread_local = threading.local()
+        self._thread_local.connection = conn
+
         # Set connection and cursor
         self.set_connection(connection=conn)
         self.set_cursor(conn.cursor())
 
+    @contextmanager
+    def _acquire_connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        Acquire the connection of the current thread, opening it on first use.
+
+        Connections opened here are closed when their thread exits, so the
+        short-lived threads of timers and per-call executors leave none behind.
+        When a connection pool is configured, a pooled connection is borrowed instead.
+
+        :return: Iterator yielding the connection to use.
+        """
+        if self._memory_db:
+            with self._shared_connection_lock:
+                yield self.get_connection()
+            return
+
+        if self._connection_pool is not None:
+            with super()._acquire_connection() as conn:
+                yield conn
+            return
+
+        conn = getattr(self._thread_local, "connection", None)
+        if conn is None:
+            holder = _ThreadConnection(self._create_connection())
+            with self._thread_connections_lock:
+                self._thread_connections.add(holder)
+            self._thread_local.holder = holder
+            self._thread_local.connection = conn = holder.connection
+        yield conn
+
+    def _begin(self, connection: sqlite3.Connection) -> None:
+        """
+        Start a transaction explicitly, in the configured "transaction_mode".
+
+        :param connection: The connection pinned for the transaction.
+        :return: None.
+        """
+        if not connection.in_transaction:
+            connection.execute(self._begin_statement())
+
+    def _begin_statement(self) -> str:
+        """
+        Get the BEGIN statement of the configured "transaction_mode".
+
+        :return: The BEGIN statement.
+        """
+        return f"BEGIN {self.get_config().get('transaction_mode', DEFAULT_TRANSACTION_MODE)}"
+
+    def _commit(self, connection: sqlite3.Connection) -> None:
+        """
+        Commit a transaction() block and drop the cached reads its writes changed.
+
+        Readers on other connections may have cached the pre-commit rows while
+        the block ran, so the query cache is invalidated again once the writes
+        are visible.
+
+        :param connection: The connection pinned for the transaction.
+        :return: None.
+        """
+        connection.commit()
+        self._invalidate_committed_writes()
+
+    def _rollback(self, connection: sqlite3.Connection) -> None:
+        """
+        Roll back a failed transaction() block, unless it left nothing pending.
+
+        :param connection: The connection pinned for the transaction.
+        :return: None.
+        """
+        self._uncommitted_writes.statements = None
+        if connection.in_transaction:
+            connection.rollback()
+
     def _disconnect(self) -> None:
         """
         Disconnect from the SQLite database.
@@ -167,14 +651,39 @@ class SQLite3_DataProvider(Database_DataProvider):
         :return: None.
         :raises sqlite3.Error: If disconnection fails.
         """
+        # Write out the buffered writes before closing the connections. Failed
+        # writes stay buffered and the error is raised once everything is closed.
+        flush_error: Optional[Exception] = None
+        try:
+            self.flush_writes()
+        except self.DRIVER_EXCEPTIONS as e:
+            flush_error = e
+
         if self._cursor is not None:
             self._cursor.close()
             self._cursor = None
 
-        conn = self.get_connection()
-        if conn is not None:
-            conn.close()
-            self.set_connection(connection=None)
+        # Stop the fetch_parallel workers
+        self._shutdown_executor()
+
+        # Stop using the pool, which is closed once no provider references it
+        self._connection_pool = None
+
+        # Close the connections opened by every thread, and forget them so that
+        # threads open new ones after a reconnect
+        with self._thread_connections_lock:
+            holders = list(self._thread_connections)
+            self._thread_connections.clear()
+        for holder in holders:
+            holder.close()
+        self._thread_local = threading.local()
+        connection = self.get_connection()
+        if connection is not None:
+            connection.close()
+        self.set_connection(connection=None)
+
+        if flush_error is not None:
+            raise flush_error
 
     ###################################################################
     # Core Instance Method: Execute
@@ -200,7 +709,8 @@ class SQLite3_DataProvider(Database_DataProvider):
                       - "none": Don't fetch results (for INSERT/UPDATE/DELETE).
         :param commit: Whether to commit the transaction after execution.
         :param kwargs: Additional keyword arguments.
-                       - fetch_size: Number of rows to fetch when fetch="many".
+                       - fetch_size: Number of rows to fetch when fetch_mode="many".
+                       - as_dict: Return rows as dictionaries instead of sqlite3.Row.
         :return: Query results based on fetch mode, or lastrowid for INSERT operations.
         :raises sqlite3.Error: If query execution fails.
         :raises ValueError: If invalid fetch mode is specified.
@@ -208,34 +718,56 @@ class SQLite3_DataProvider(Database_DataProvider):
         # Check if the database is connected
         self.check_db_connection()
 
-        # Get the connection and the cursor
-        conn = self.get_connection()
-        cursor = self.get_cursor()
+        # Let the planner stop after the rows that will actually be fetched
+        if fetch_mode == "many":
+            sql = self._limit_query(sql=sql, size=kwargs.get("fetch_size", 100))
 
-        # Execute the query with or without parameters
-        if params is not None:
-            cursor.execute(sql, params)
-        else:
-            cursor.execute(sql)
+        # Serve repeated reads from the query cache
+        as_dict = kwargs.get("as_dict", False)
+        is_read, is_read_only, for_update, read_tables, _ = _statement_info(sql)
+        cache_key = None
+        if self._query_cache is not None and is_read and fetch_mode in ("all", "one"):
+            if not self.in_transaction() and not for_update:
+                cache_key = (sql, repr(params), fetch_mode, as_dict)
+                cached = self._query_cache.get(cache_key)
+                if cached is not None:
+                    return _copy_result(cached[1])
 
-        # Commit if requested
-        if commit:
-            conn.commit()
+        with self.acquire_connection() as conn:
+            cursor = conn.cursor()
 
-        # Fetch results based on mode
-        if fetch_mode == "all":
-            return cursor.fetchall()
-        elif fetch_mode == "one":
-            return cursor.fetchone()
-        elif fetch_mode == "many":
-            fetch_size = kwargs.get("fetch_size", 100)
-            return cursor.fetchmany(fetch_size)
-        elif fetch_mode == "last_id":
-            return cursor.lastrowid
-        elif fetch_mode == "none":
-            return None
-        else:
-            raise ValueError(f"Invalid fetch mode: {fetch_mode}. Must be 'all', 'one', 'many', or 'none'.")
+            # Execute the query with or without parameters. A failed write rolls
+            # back the implicit transaction it opened; reads have nothing to undo.
+            try:
+                if params is not None:
+                    cursor.execute(sql, params)
+                else:
+                    cursor.execute(sql)
+            except self.DRIVER_EXCEPTIONS:
+                if (
+                    commit
+                    and conn.in_transaction
+                    and not self.in_transaction()
+                    and not is_read_only
+                ):
+                    conn.rollback()
+                raise
+
+            # Commit if requested, unless a transaction() block commits at its end
+            if commit and not self.in_transaction():
+                conn.commit()
+
+            # Fetch results based on mode
+            result = self._fetch_results(cursor=cursor, fetch_mode=fetch_mode, options=kwargs)
+
+        # Cache the read, or drop the cached reads a write may have changed
+        if cache_key is not None and self._query_cache is not None:
+            self._query_cache.set(cache_key, (read_tables, _copy_result(result)))
+        elif not is_read:
+            self.invalidate_query_cache(sql=sql)
+            if not commit or self.in_transaction():
+                self._note_uncommitted_write(sql=sql)
+        return result
 
     def execute_many(
         self,
@@ -243,43 +775,283 @@ class SQLite3_DataProvider(Database_DataProvider):
         params_list: List[Union[Tuple, Dict[str, Any]]],
         fetch_mode: str = "all",
         commit: bool = True,
-    ) -> None:
+        **kwargs,
+    ) -> Any:
         """
         Execute a SQL statement on the SQLite database multiple times with different parameters.
 
         :param sql: The SQL statement to execute.
         :param params_list: List of parameter tuples or dicts.
         :param commit: Whether to commit the transaction (default: True).
-        :return: None.
+        :param kwargs: Additional keyword arguments.
+                       - fetch_size: Number of rows to fetch when fetch_mode="many".
+                       - as_dict: Return rows as dictionaries instead of sqlite3.Row.
+        :return: Query results based on fetch mode.
         """
         # Check if the database is connected
         self.check_db_connection()
 
-        # Get the connection and the cursor
-        conn = self.get_connection()
-        cursor = self.get_cursor()
+        with self.acquire_connection() as conn:
+            cursor = conn.cursor()
 
-        # Execute the query with multiple parameter groups
-        cursor.executemany(sql, params_list)
+            # Open the transaction explicitly so the whole batch is written in one
+            # journal commit rather than relying on the driver's implicit BEGIN
+            explicit_transaction = commit and not self.in_transaction() and not conn.in_transaction
+            if explicit_transaction:
+                cursor.execute(self._begin_statement())
 
-        # Commit if requested
-        if commit:
-            conn.commit()
+            # Execute the query with multiple parameter groups
+            try:
+                if fetch_mode in ("all", "none") and self._execute_values(cursor, sql, params_list):
+                    pass
+                else:
+                    cursor.executemany(sql, params_list)
+            except self.DRIVER_EXCEPTIONS:
+                if explicit_transaction:
+                    conn.rollback()
+                raise
+
+            # Commit if requested, unless a transaction() block commits at its end
+            if commit and not self.in_transaction():
+                conn.commit()
+
+            # Drop the cached reads the batch may have changed
+            self.invalidate_query_cache(sql=sql)
+            if not commit or self.in_transaction():
+                self._note_uncommitted_write(sql=sql)
+
+            # Fetch results based on mode
+            return self._fetch_results(cursor=cursor, fetch_mode=fetch_mode, options=kwargs)
+
+    ###################################################################
+    # Buffered Write Methods
+    ###################################################################
+    def buffer_write(
+        self,
+        sql: str,
+        params: Union[Tuple, Dict[str, Any]],
+        key: Optional[Hashable] = None,
+    ) -> None:
+        """
+        Queue a write statement, to be executed together with the other writes of the same statement.
+
+        The buffer is flushed with one execute_many() call per statement once it
+        holds "write_buffer_size" writes (default 500), every "write_flush_interval"
+        seconds when that config entry is set, on flush_writes() and on disconnect.
+        Writes queued with the same key replace each other, so only the last one
+        within a flush is executed.
+
+        :param sql: The write statement.
+        :param params: The statement parameters.
+        :param key: Key identifying the written record, for last-write-wins deduplication.
+        :return: None.
+        """
+        config = self.get_config()
+        with self._write_buffer_lock:
+            pending = self._write_buffer.setdefault(sql, {})
+            if key is None:
+                key = object()
+            elif key in pending:
+                del pending[key]
+                self._write_buffer_count -= 1
+            pending[key] = params
+            self._write_buffer_count += 1
+
+            if self._write_buffer_count >= config.get("write_buffer_size", DEFAULT_WRITE_BUFFER_SIZE):
+                self.flush_writes()
+                return
+
+            flush_interval = config.get("write_flush_interval") or 0
+            if flush_interval > 0 and self._flush_timer is None:
+                self._flush_timer = threading.Timer(flush_interval, self._flush_writes_on_timer)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def flush_writes(self) -> int:
+        """
+        Execute the buffered writes, one execute_many() call per statement.
+
+        Each statement's writes leave the buffer only once they succeed. When a
+        statement fails, the other statements are still executed, the failed
+        writes stay buffered for the next flush, and the first error is raised.
+        Inside a transaction() block nothing is flushed, since a rollback would
+        discard writes that already left the buffer; the next flush outside the
+        block writes them.
 
-        # Fetch results based on mode
-        if fetch_mode == "all":
-            return cursor.fetchall()
-        elif fetch_mode == "one":
-            return cursor.fetchone()
-        elif fetch_mode == "many":
-            fetch_size = kwargs.get("fetch_size", 100)
-            return cursor.fetchmany(fetch_size)
-        elif fetch_mode == "last_id":
-            return cursor.lastrowid
-        elif fetch_mode == "none":
-            return None
-        else:
+        :return: Number of writes executed.
+        :raises sqlite3.Error: If the writes of a statement fail.
+        """
+        if self.in_transaction():
+            return 0
+
+        with self._write_buffer_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            executed = 0
+            error: Optional[Exception] = None
+            for sql in list(self._write_buffer):
+                pending = self._write_buffer[sql]
+                try:
+                    self.execute_many(sql, list(pending.values()), fetch_mode="none")
+                except self.DRIVER_EXCEPTIONS as e:
+                    error = error or e
+                    continue
+                del self._write_buffer[sql]
+                self._write_buffer_count -= len(pending)
+                executed += len(pending)
+            if error is not None:
+                raise error
+            return executed
+
+    def get_pending_write_count(self) -> int:
+        """
+        Get the number of buffered writes not yet executed.
+
+        :return: The number of buffered writes.
+        """
+        return self._write_buffer_count
+
+    def _flush_writes_on_timer(self) -> None:
+        """
+        Flush the buffered writes from the flush timer thread, logging failures.
+
+        A timer that was cancelled or replaced while waiting for the buffer lock
+        leaves the flush to the current one.
+
+        :return: None.
+        """
+        with self._write_buffer_lock:
+            if self._flush_timer is not threading.current_thread():
+                return
+            self._flush_timer = None
+            try:
+                self.flush_writes()
+            except self.DRIVER_EXCEPTIONS as e:
+                self.logger.error("Failed to flush buffered writes: %s", e)
+
+    def _fetch_results(self, cursor: sqlite3.Cursor, fetch_mode: str, options: Dict[str, Any]) -> Any:
+        """
+        Read the results of an executed statement according to the fetch mode.
+
+        :param cursor: The cursor the statement was executed on.
+        :param fetch_mode: Fetch mode - "all", "one", "many", "last_id" or "none".
+        :param options: The keyword arguments of the execute call (as_dict, fetch_size).
+        :return: Query results based on fetch mode.
+        :raises ValueError: If invalid fetch mode is specified.
+        """
+        handler = self._FETCH_HANDLERS.get(fetch_mode)
+        if handler is None:
             raise ValueError(f"Invalid fetch mode: {fetch_mode}. Must be 'all', 'one', 'many', or 'none'.")
+        return handler(cursor, options.get("as_dict", False), options)
+
+    ###################################################################
+    # Query Cache Methods
+    ###################################################################
+    def invalidate_query_cache(self, sql: Optional[str] = None) -> None:
+        """
+        Drop cached query results.
+
+        When a write statement is given, only the results reading a table it
+        writes to are dropped; if no table can be parsed from it, or no statement
+        is given, the whole cache is cleared.
+
+        :param sql: The write statement that was executed.
+        :return: None.
+        """
+        if self._query_cache is None:
+            return
+        tables = _statement_info(sql)[4] if sql else frozenset()
+        if not tables:
+            self._query_cache.invalidate()
+            return
+        self._query_cache.invalidate(
+            lambda key, value: not value[0] or not tables.isdisjoint(value[0])
+        )
+
+    def _note_uncommitted_write(self, sql: str) -> None:
+        """
+        Remember a write statement of the current thread until its transaction commits.
+
+        :param sql: The write statement that was executed.
+        :return: None.
+        """
+        if self._query_cache is None:
+            return
+        statements = getattr(self._uncommitted_writes, "statements", None)
+        if statements is None:
+            statements = self._uncommitted_writes.statements = set()
+        statements.add(sql)
+
+    def _invalidate_committed_writes(self) -> None:
+        """
+        Drop the cached reads changed by the write statements the current thread just committed.
+
+        :return: None.
+        """
+        statements = getattr(self._uncommitted_writes, "statements", None)
+        self._uncommitted_writes.statements = None
+        for sql in statements or ():
+            self.invalidate_query_cache(sql=sql)
+
+    def get_query_cache_info(self) -> Optional[Dict[str, Any]]:
+        """
+        Get the query cache statistics.
+
+        :return: Dictionary of cache statistics, or None if caching is disabled.
+        """
+        return self._query_cache.info() if self._query_cache is not None else None
+
+    @staticmethod
+    def _limit_query(sql: str, size: int) -> str:
+        """
+        Append a LIMIT clause to a SELECT query that does not already have one.
+
+        :param sql: The SQL query.
+        :param size: The maximum number of rows to return.
+        :return: The limited query, or the original one if it does not qualify.
+        """
+        if not _statement_info(sql)[0] or _LIMIT_PATTERN.search(sql) is not None:
+            return sql
+        return f"{sql.rstrip().rstrip(';').rstrip()} LIMIT {int(size)}"
+
+    def _execute_values(
+        self,
+        cursor: sqlite3.Cursor,
+        sql: str,
+        params_list: List[Union[Tuple, Dict[str, Any]]],
+    ) -> bool:
+        """
+        Execute a plain positional INSERT as multi-row VALUES statements.
+
+        Only row templates made of bare "?" markers are rewritten; numbered and
+        named placeholders are left to executemany(). Each statement carries as many rows as fit under SQLITE_MAX_VARIABLES, so
+        the batch runs as a handful of statements instead of one per row.
+
+        :param cursor: The cursor to execute on.
+        :param sql: The SQL statement to execute.
+        :param params_list: List of parameter tuples.
+        :return: True if the batch was executed, False if the statement does not qualify.
+        """
+        match = _INSERT_VALUES_PATTERN.match(sql)
+        if match is None or not params_list:
+            return False
+
+        prefix, row_template = match.groups()
+        if _NON_BARE_PLACEHOLDER_PATTERN.search(row_template):
+            return False
+        row_size = row_template.count("?")
+        if row_size == 0 or any(
+            isinstance(params, dict) or len(params) != row_size for params in params_list
+        ):
+            return False
+
+        rows_per_page = max(1, SQLITE_MAX_VARIABLES // row_size)
+        for start in range(0, len(params_list), rows_per_page):
+            page = params_list[start:start + rows_per_page]
+            page_sql = f"{prefix} {','.join([row_template] * len(page))}"
+            cursor.execute(page_sql, [value for params in page for value in params])
+        return True
 
     ###################################################################
     # Core Instance Methods: Fetch One/Many/All
@@ -288,45 +1060,337 @@ class SQLite3_DataProvider(Database_DataProvider):
         self,
         sql: str,
         params: Optional[Union[Tuple, Dict[str, Any]]] = None,
-    ) -> Optional[sqlite3.Row]:
+        as_dict: bool = False,
+    ) -> Optional[Union[sqlite3.Row, Dict[str, Any]]]:
         """
         Execute a SELECT query and fetch a single result.
 
         :param sql: The SQL SELECT query.
         :param params: Optional parameters for parameterized queries.
+        :param as_dict: Return the row as a dictionary (default: False).
         :return: Single result row or None.
         """
-        return self.execute(sql=sql, params=params, fetch="one")
+        row: Optional[Union[sqlite3.Row, Dict[str, Any]]] = self.execute(
+            sql=sql, params=params, fetch_mode="one", as_dict=as_dict
+        )
+        return row
 
     def fetch_many(
         self,
         sql: str,
         params: Optional[Union[Tuple, Dict[str, Any]]] = None,
         fetch_size: int = 100,
-    ) -> List[sqlite3.Row]:
+        as_dict: bool = False,
+    ) -> List[Union[sqlite3.Row, Dict[str, Any]]]:
         """
         Execute a SELECT query and fetch multiple results.
 
         :param sql: The SQL SELECT query.
         :param params: Optional parameters for parameterized queries.
         :param fetch_size: Number of rows to fetch (default: 100).
+        :param as_dict: Return rows as dictionaries (default: False).
         :return: List of result rows.
         """
-        return self.execute(sql=sql, params=params, fetch="many", fetch_size=fetch_size)
+        rows: List[Union[sqlite3.Row, Dict[str, Any]]] = self.execute(
+            sql=sql, params=params, fetch_mode="many", fetch_size=fetch_size, as_dict=as_dict
+        )
+        return rows
 
     def fetch_all(
         self,
         sql: str,
         params: Optional[Union[Tuple, Dict[str, Any]]] = None,
-    ) -> List[sqlite3.Row]:
+        as_dict: bool = False,
+    ) -> List[Union[sqlite3.Row, Dict[str, Any]]]:
         """
         Execute a SELECT query and fetch all results.
 
         :param sql: The SQL SELECT query.
         :param params: Optional parameters for parameterized queries.
+        :param as_dict: Return rows as dictionaries (default: False).
+        :return: List of all result rows.
+        """
+        rows: List[Union[sqlite3.Row, Dict[str, Any]]] = self.execute(
+            sql=sql, params=params, fetch_mode="all", as_dict=as_dict
+        )
+        return rows
+
+    ###################################################################
+    # Core Instance Method: Fetch By Keys
+    ###################################################################
+    def fetch_by_keys(
+        self,
+        table: str,
+        key_col: str,
+        keys: List[Any],
+        as_dict: bool = False,
+    ) -> Dict[Any, Union[sqlite3.Row, Dict[str, Any]]]:
+        """
+        Fetch the rows of a table matching a list of keys with batched IN queries.
+
+        Keys are deduplicated and looked up SQLITE_MAX_VARIABLES at a time, so N
+        lookups cost one query per chunk instead of one query per key.
+
+        :param table: Name of the table.
+        :param key_col: Name of the key column.
+        :param keys: The keys to look up.
+        :param as_dict: Return rows as dictionaries (default: False).
+        :return: Dictionary mapping each found key to its row.
+        """
+        unique_keys = list(dict.fromkeys(keys))
+        rows_by_key = {}
+        for start in range(0, len(unique_keys), SQLITE_MAX_VARIABLES):
+            chunk = unique_keys[start:start + SQLITE_MAX_VARIABLES]
+            sql = f"SELECT * FROM {table} WHERE {key_col} IN ({self.generate_markers(size=len(chunk))})"
+            for row in self.fetch_all(sql=sql, params=tuple(chunk), as_dict=as_dict):
+                rows_by_key[row[key_col]] = row
+        return rows_by_key
+
+    ###################################################################
+    # Core Instance Method: Bulk Insert
+    ###################################################################
+    def bulk_insert(
+        self,
+        table: str,
+        columns: List[str],
+        rows: List[Union[Tuple, Dict[str, Any]]],
+        conflict: Optional[str] = None,
+    ) -> int:
+        """
+        Insert many rows into a table with multi-row VALUES statements.
+
+        Each statement carries as many rows as fit under SQLITE_MAX_VARIABLES, and
+        the whole insert runs in one transaction through execute_many().
+
+        :param table: Name of the table.
+        :param columns: Names of the inserted columns.
+        :param rows: The rows to insert, as tuples of values in column order or as dictionaries keyed by column.
+        :param conflict: Conflict resolution, e.g. "REPLACE" or "IGNORE" for INSERT OR REPLACE/IGNORE.
+        :return: Number of rows inserted.
+        :raises KeyError: If a dictionary row lacks one of the columns.
+        """
+        if not rows:
+            return 0
+
+        # Pick the column values out of dictionary rows in C with an itemgetter
+        if isinstance(rows[0], Mapping):
+            if len(columns) == 1:
+                getter = operator.itemgetter(columns[0])
+                rows = [(getter(row),) for row in rows]
+            else:
+                rows = list(map(operator.itemgetter(*columns), rows))
+
+        verb = f"INSERT OR {conflict.upper()}" if conflict else "INSERT"
+        sql = f"{verb} INTO {table} ({', '.join(columns)}) VALUES ({self.generate_markers(size=len(columns))})"
+        self.execute_many(sql=sql, params_list=rows, fetch_mode="none")
+        return len(rows)
+
+    ###################################################################
+    # Core Instance Method: Prepare
+    ###################################################################
+    def prepare(self, sql: str) -> SQLite3_PreparedStatement:
+        """
+        Bind a SQL statement to the provider, to be executed many times, e.g. inside an insert loop.
+
+        The handle is a convenience alias of execute() and execute_many() with the
+        same defaults; sqlite3 reuses the compiled statement from each
+        connection's statement cache either way.
+
+        :param sql: The SQL statement.
+        :return: The statement handle.
+        """
+        return SQLite3_PreparedStatement(provider=self, sql=sql)
+
+    ###################################################################
+    # Core Instance Method: Fetch Parallel
+    ###################################################################
+    def get_executor(self) -> ThreadPoolExecutor:
+        """
+        Get the worker pool used by fetch_parallel, creating it on first use.
+
+        :return: The thread pool executor.
+        """
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.get_config().get("pool_size", DEFAULT_POOL_SIZE),
+                    thread_name_prefix=f"sqlite3-{self.instance_id}",
+                )
+            return self._executor
+
+    def fetch_parallel(
+        self,
+        calls: List[Tuple[str, Optional[Union[Tuple, Dict[str, Any]]]]],
+        as_dict: bool = False,
+    ) -> List[List[Union[sqlite3.Row, Dict[str, Any]]]]:
+        """
+        Run independent SELECT queries concurrently and fetch all of their results.
+
+        Each worker thread reads through its own connection, so with a file database
+        in WAL mode the queries do not wait on each other.
+
+        :param calls: List of (sql, params) pairs.
+        :param as_dict: Return rows as dictionaries (default: False).
+        :return: List of result lists, in the same order as calls.
+        """
+        if len(calls) <= 1 or self.is_memory_db():
+            return [self.fetch_all(sql=sql, params=params, as_dict=as_dict) for sql, params in calls]
+
+        executor = self.get_executor()
+        futures = [
+            executor.submit(self.fetch_all, sql=sql, params=params, as_dict=as_dict)
+            for sql, params in calls
+        ]
+        return [future.result() for future in futures]
+
+    def fetch_paginated(
+        self,
+        sql: str,
+        params: Optional[Union[Tuple, Dict[str, Any]]] = None,
+        page_size: int = 1000,
+        prefetch_pages: int = 2,
+        as_dict: bool = False,
+    ) -> Iterator[List[Union[sqlite3.Row, Dict[str, Any]]]]:
+        """
+        Walk a SELECT query page by page with LIMIT/OFFSET, fetching pages ahead.
+
+        Up to prefetch_pages pages are requested on the worker pool while the
+        caller processes the current one. In-memory databases fetch page by page.
+
+        :param sql: The SQL SELECT query, without LIMIT/OFFSET.
+        :param params: Optional parameters for parameterized queries.
+        :param page_size: Number of rows per page (default: 1000).
+        :param prefetch_pages: Number of pages requested ahead of the consumer (default: 2).
+        :param as_dict: Return rows as dictionaries (default: False).
+        :return: Iterator over the pages of rows; the last page may be short.
+        """
+        base_sql = sql.rstrip().rstrip(";").rstrip()
+        page_size = int(page_size)
+
+        def fetch_page(page: int) -> List[Union[sqlite3.Row, Dict[str, Any]]]:
+            page_sql = f"{base_sql} LIMIT {page_size} OFFSET {page * page_size}"
+            return self.fetch_all(sql=page_sql, params=params, as_dict=as_dict)
+
+        if self._memory_db or prefetch_pages <= 0:
+            page = 0
+            while True:
+                rows = fetch_page(page)
+                if rows:
+                    yield rows
+                if len(rows) < page_size:
+                    return
+                page += 1
+
+        executor = self.get_executor()
+        pending = deque(executor.submit(fetch_page, page) for page in range(prefetch_pages + 1))
+        next_page = prefetch_pages + 1
+        try:
+            while pending:
+                rows = pending.popleft().result()
+                if rows:
+                    yield rows
+                if len(rows) < page_size:
+                    return
+                pending.append(executor.submit(fetch_page, next_page))
+                next_page += 1
+        finally:
+            for future in pending:
+                future.cancel()
+
+    ###################################################################
+    # Async Methods
+    ###################################################################
+    async def _run_sync(self, fn: Any, *args: Any, **kwargs: Any) -> Any:
+        """
+        Run a blocking provider method on the worker pool from a coroutine.
+
+        Each worker thread keeps its own connection, so calls never share a
+        connection across threads.
+
+        :param fn: The blocking callable.
+        :param args: Positional arguments for the callable.
+        :param kwargs: Keyword arguments for the callable.
+        :return: The callable's result.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.get_executor(), functools.partial(fn, *args, **kwargs))
+
+    async def execute_async(self, *args: Any, **kwargs: Any) -> Any:
+        """
+        Awaitable version of execute() that runs off the event loop.
+
+        :return: Query results based on fetch mode.
+        """
+        return await self._run_sync(self.execute, *args, **kwargs)
+
+    async def execute_many_async(self, *args: Any, **kwargs: Any) -> Any:
+        """
+        Awaitable version of execute_many() that runs off the event loop.
+
+        :return: Query results based on fetch mode.
+        """
+        return await self._run_sync(self.execute_many, *args, **kwargs)
+
+    async def fetch_one_async(self, *args: Any, **kwargs: Any) -> Optional[Union[sqlite3.Row, Dict[str, Any]]]:
+        """
+        Awaitable version of fetch_one() that runs off the event loop.
+
+        :return: Single result row or None.
+        """
+        row: Optional[Union[sqlite3.Row, Dict[str, Any]]] = await self._run_sync(self.fetch_one, *args, **kwargs)
+        return row
+
+    async def fetch_all_async(self, *args: Any, **kwargs: Any) -> List[Union[sqlite3.Row, Dict[str, Any]]]:
+        """
+        Awaitable version of fetch_all() that runs off the event loop.
+
         :return: List of all result rows.
         """
-        return self.execute(sql=sql, params=params, fetch="all")
+        rows: List[Union[sqlite3.Row, Dict[str, Any]]] = await self._run_sync(self.fetch_all, *args, **kwargs)
+        return rows
+
+    ###################################################################
+    # Core Instance Method: Iterate
+    ###################################################################
+    def iterate(
+        self,
+        sql: str,
+        params: Optional[Union[Tuple, Dict[str, Any]]] = None,
+        itersize: int = 2000,
+        as_dict: bool = False,
+    ) -> Iterator[Union[sqlite3.Row, Dict[str, Any]]]:
+        """
+        Execute a SELECT query and stream its rows.
+
+        Rows are pulled from the cursor in chunks of itersize, so only one chunk is
+        held in memory at a time and consumers can start before the query finishes.
+
+        :param sql: The SQL SELECT query.
+        :param params: Optional parameters for parameterized queries.
+        :param itersize: Number of rows fetched from the cursor per round (default: 2000).
+        :param as_dict: Yield rows as dictionaries (default: False).
+        :return: Iterator over the result rows.
+        """
+        # Check if the database is connected
+        self.check_db_connection()
+
+        with self.acquire_connection() as conn:
+            cursor = conn.cursor()
+            try:
+                if params is not None:
+                    cursor.execute(sql, params)
+                else:
+                    cursor.execute(sql)
+
+                while True:
+                    rows = cursor.fetchmany(itersize)
+                    if not rows:
+                        break
+                    if as_dict:
+                        rows = self.rows_to_dicts(rows, cursor.description)
+                    yield from rows
+            finally:
+                cursor.close()
 
     ###################################################################
     # Core Instance Method: Commit
@@ -336,7 +1400,10 @@ class SQLite3_DataProvider(Database_DataProvider):
         Commit the current transaction.
         """
         self.check_db_connection()
-        self.get_connection().commit()
+        with self.acquire_connection() as conn:
+            conn.commit()
+        if not self.in_transaction():
+            self._invalidate_committed_writes()
 
     ###################################################################
     # Core Instance Method: Rollback
@@ -348,7 +1415,10 @@ class SQLite3_DataProvider(Database_DataProvider):
         :return: None.
         """
         self.check_db_connection()
-        self.get_connection().rollback()
+        with self.acquire_connection() as conn:
+            conn.rollback()
+        if not self.in_transaction():
+            self._uncommitted_writes.statements = None
 
     ###################################################################
     # Utility Methods
@@ -376,7 +1446,7 @@ class SQLite3_DataProvider(Database_DataProvider):
         result = self.fetch_one(sql=sql, params=(table_name,))
         return result is not None
 
-    def get_table_info(self, table_name: str) -> List[sqlite3.Row]:
+    def get_table_info(self, table_name: str) -> List[Union[sqlite3.Row, Dict[str, Any]]]:
         """
         Get column information for a table.
 
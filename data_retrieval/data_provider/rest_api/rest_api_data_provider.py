@@ -11,10 +11,17 @@
 # Import Packages
 #######################################################################
 # Standard Packages
+import copy
+import hashlib
+import inspect
+import json as jsonlib
 import logging
+import threading
 from abc import ABC
 from collections.abc import Generator
-from typing import Any, Dict, List, Optional
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from types import MappingProxyType, ModuleType
+from typing import Any, ClassVar, Dict, Iterator, List, Optional, Tuple, Type, Union
 
 # Third-party Packages
 import requests
@@ -25,6 +32,76 @@ from urllib3.util import Retry
 
 # Local Packages
 from data_retrieval.model.data_provider import DataProvider
+from data_retrieval.utils.cache_utils import TTLCache
+
+# Optional Packages
+orjson: Optional[ModuleType]
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+#######################################################################
+# Constants
+#######################################################################
+# Size of the HTTP connection pool mounted on each Session, overridable via
+# the "pool_maxsize" config entry
+DEFAULT_POOL_MAXSIZE = 100
+
+# Default HTTP headers for API requests, kept read-only since they are shared
+_DEFAULT_HEADERS = MappingProxyType({
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Accept": "application/json, text/plain, */*",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Content-Type": "application/json",
+    "Connection": "keep-alive",
+})
+
+# Keys under which listing responses commonly nest their records
+_DATA_KEYS = ("results", "items", "data", "content")
+
+# Fields describing the pagination state of a listing response
+_PAGINATION_FIELDS = frozenset({
+    "page", "page_size", "pages", "next", "previous", "has_next",
+    "has_previous", "total", "count", "total_items", "totalCount",
+})
+
+# Number of requests fetch_multiple runs at once, overridable via the
+# "max_concurrency" config entry
+DEFAULT_MAX_CONCURRENCY = 10
+
+# Fields reporting the total number of items, in order of preference
+_TOTAL_KEYS = ("total", "count", "total_items", "totalCount")
+
+# Response status codes retried by the Session, overridable via the
+# "retry_status_codes" config entry
+DEFAULT_RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Upper bound in seconds of the delay between two retries, overridable via the
+# "retry_backoff_max" config entry
+DEFAULT_RETRY_BACKOFF_MAX = 30.0
+
+# Retry arguments of the installed urllib3; jitter and a configurable backoff
+# cap only exist from urllib3 2.0
+_RETRY_PARAMETERS = frozenset(inspect.signature(Retry.__init__).parameters)
+
+# Number of seconds the validator of a GET response is kept for conditional
+# requests, overridable via the "etag_cache_ttl" config entry
+DEFAULT_ETAG_CACHE_TTL = 3600.0
+
+
+#######################################################################
+# Helper Functions
+#######################################################################
+def _copy_response(result: Dict) -> Dict:
+    """
+    Copy a decoded response so that callers cannot change a cached or shared one.
+
+    :param result: The decoded response.
+    :return: The copied response.
+    """
+    return copy.deepcopy(result)
 
 
 #######################################################################
@@ -41,9 +118,26 @@ class RestAPI_DataProvider(DataProvider, ABC):
     ###################################################################
     # Class Attributes
     ###################################################################
-    __name = "RestAPI_DataProvider"
-    __type = "RestAPI_DataProvider"
-    __base_url: str = ""
+    name: ClassVar[str] = "RestAPI_DataProvider"
+    type: ClassVar[str] = "RestAPI_DataProvider"
+    default_base_url: ClassVar[str] = ""
+
+    # Sessions shared by the instances created with share_session=True, keyed by
+    # their connection settings
+    _shared_sessions: Dict[Tuple, requests.Session] = {}
+    _shared_sessions_lock = threading.Lock()
+
+    __slots__ = (
+        "_base_url",
+        "_base_url_prefix",
+        "_timeout",
+        "_max_retries",
+        "_retry_backoff_factor",
+        "_inflight",
+        "_inflight_lock",
+        "_get_cache",
+        "_etag_cache",
+    )
     
     ###################################################################
     # Constructor Method
@@ -84,29 +178,32 @@ class RestAPI_DataProvider(DataProvider, ABC):
         self.update_data_methods(
             {
                 "http_request": self._make_request,
+                "fetch_page": self.fetch_page,
+                "fetch_multiple": self.fetch_multiple,
             }
         )
         
         # Initialize REST API specific attributes
-        self._base_url = base_url or self.__base_url
+        self.set_base_url(base_url or self.default_base_url)
         self._timeout = timeout
         self._max_retries = max_retries
         self._retry_backoff_factor = retry_backoff_factor
+        self._inflight: Dict[Tuple, "Future[Dict]"] = {}
+        self._inflight_lock = threading.Lock()
+        ## Short-lived cache of GET responses, enabled by a positive "get_cache_ttl" config entry
+        get_cache_ttl = self.get_config().get("get_cache_ttl") or 0
+        self._get_cache: Optional[TTLCache] = TTLCache(maxsize=256, ttl=get_cache_ttl) if get_cache_ttl > 0 else None
+        ## Validators of GET responses for conditional requests, enabled by a positive "etag_cache_size" config entry
+        etag_cache_size = self.get_config().get("etag_cache_size") or 0
+        self._etag_cache: Optional[TTLCache] = (
+            TTLCache(maxsize=etag_cache_size, ttl=self.get_config().get("etag_cache_ttl", DEFAULT_ETAG_CACHE_TTL))
+            if etag_cache_size > 0
+            else None
+        )
         
         # Connect to the Session
         self.connect()
 
-        # Initialize session with retry strategy
-        retry_strategy = Retry(
-            total=max_retries,
-            backoff_factor=retry_backoff_factor,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS"]
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.get_connection().mount("http://", adapter)
-        self.get_connection().mount("https://", adapter)
-
     ###################################################################
     # Getter & Setter Methods
     ###################################################################
@@ -116,15 +213,30 @@ class RestAPI_DataProvider(DataProvider, ABC):
 
         :return: The base URL of the API server.
         """
-        return self.__base_url
+        return self._base_url
     
     def set_base_url(self, base_url: str) -> None:
         """
         Set the base URL of the API server.
+
+        The prefix joined with relative endpoint URLs is computed here once rather
+        than on every request.
         
         :param base_url: The base URL of the API server.
         """
-        self.__base_url = base_url.rstrip("/")
+        self._base_url = base_url.rstrip("/")
+        self._base_url_prefix = self._base_url + "/" if self._base_url else ""
+
+    def resolve_url(self, url: str) -> str:
+        """
+        Resolve an endpoint URL against the base URL.
+
+        :param url: Absolute URL, or endpoint path relative to the base URL.
+        :return: The absolute URL.
+        """
+        if not self._base_url_prefix or url.startswith(("http://", "https://")):
+            return url
+        return self._base_url_prefix + url.lstrip("/")
 
     ###################################################################
     # Core Instance Method: Make Request to REST API Server
@@ -135,7 +247,7 @@ class RestAPI_DataProvider(DataProvider, ABC):
         method: str,
         params: Optional[Dict] = None,
         data: Optional[Dict] = None,
-        json: Optional[Dict] = None,
+        json: Optional[Union[Dict, bytes]] = None,
         headers: Optional[Dict] = None,
         authentication: Optional[Any] = None,
     ) -> Dict:
@@ -146,20 +258,118 @@ class RestAPI_DataProvider(DataProvider, ABC):
         :param method: HTTP method (GET, POST, PUT, DELETE, etc.)
         :param params: Query parameters
         :param data: Form data to send
-        :param json: JSON data to send
+        :param json: JSON data to send, or an already encoded JSON body
         :param headers: Additional headers
         :param authentication: Override default authentication
         
         :return: Response data as dictionary.
         :raises: HTTPError if request fails.
         """
-        # Logging the Request
-        self.get_logger().debug(f"Making {method.upper()} request to {url}")
+        url = self.resolve_url(url)
+
+        # Only body-less GET requests are safe to share between callers
+        if method.upper() != "GET" or data is not None or json is not None:
+            return self._send_request(url, method, params, data, json, headers, authentication)
+
+        # Join an identical request already in flight instead of sending another one.
+        # Callers joining a request receive a copy of its response. The id of a
+        # custom authentication object only identifies it while the request is in
+        # flight, so its responses are never cached.
+        key = (
+            url,
+            repr(sorted(params.items())) if params else None,
+            repr(sorted(headers.items())) if headers else None,
+            id(authentication),
+        )
+        cacheable = authentication is None
+        get_cache = self._get_cache if cacheable else None
+        if get_cache is not None:
+            cached: Optional[Dict] = get_cache.get(key)
+            if cached is not None:
+                return _copy_response(cached)
+
+        with self._inflight_lock:
+            in_flight = self._inflight.get(key)
+            if in_flight is None:
+                future: "Future[Dict]" = Future()
+                self._inflight[key] = future
+        if in_flight is not None:
+            self.logger.debug("Joining in-flight GET request to %s", url)
+            return _copy_response(in_flight.result())
+
+        try:
+            result = self._send_request(
+                url, method, params, data, json, headers, authentication, validator_key=key if cacheable else None
+            )
+            if get_cache is not None and result:
+                get_cache.set(key, _copy_response(result))
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+
+    def _send_request(
+        self,
+        url: str,
+        method: str,
+        params: Optional[Dict] = None,
+        data: Optional[Union[Dict, bytes]] = None,
+        json: Optional[Union[Dict, bytes]] = None,
+        headers: Optional[Dict] = None,
+        authentication: Optional[Any] = None,
+        validator_key: Optional[Tuple] = None,
+    ) -> Dict:
+        """
+        Send an HTTP request and decode its JSON response.
+
+        When the ETag cache is enabled, a GET request identified by validator_key
+        is sent with If-None-Match, and a 304 Not Modified answer returns the
+        previously decoded body. Servers that send no ETag still get their body
+        hashed, so an unchanged body is not decoded again.
+
+        :param url: Endpoint URL (relative to base_url)
+        :param method: HTTP method (GET, POST, PUT, DELETE, etc.)
+        :param params: Query parameters
+        :param data: Form data to send
+        :param json: JSON data to send, or an already encoded JSON body
+        :param headers: Additional headers
+        :param authentication: Override default authentication
+        :param validator_key: Key of the GET request in the ETag cache.
+        :return: Response data as dictionary, or an empty dictionary if the request fails.
+        """
+        # Logging the Request, with the logger resolved once for the whole call
+        logger = self.logger
+        method = method.upper()
+        logger.debug("Making %s request to %s", method, url)
+
+        # Send JSON bodies pre-encoded: bytes are passed through as-is, and other
+        # objects are encoded with orjson when it is installed
+        if json is not None and (orjson is not None or isinstance(json, (bytes, bytearray))):
+            try:
+                data = json if isinstance(json, (bytes, bytearray)) else self.encode_json(json)
+            except TypeError:
+                pass
+            else:
+                json = None
+                if not headers or not any(key.lower() == "content-type" for key in headers):
+                    headers = {**(headers or {}), "Content-Type": "application/json"}
+
+        # Revalidate the previous response of the same GET request
+        etag_cache = self._etag_cache if validator_key is not None else None
+        validator: Optional[Tuple[Optional[str], bytes, Dict]] = (
+            etag_cache.get(validator_key) if etag_cache is not None else None
+        )
+        if validator is not None and validator[0]:
+            headers = {**(headers or {}), "If-None-Match": validator[0]}
 
         # Make the request
         try:
             response: Response = self.get_connection().request(
-                method=method.upper(),
+                method=method,
                 url=url,
                 params=params,
                 data=data,
@@ -171,18 +381,189 @@ class RestAPI_DataProvider(DataProvider, ABC):
             ## Raise an error for bad response (4xx and 5xx)
             response.raise_for_status()
 
+            ## Reuse the cached body if the server reports it unchanged
+            if validator is not None and response.status_code == 304:
+                logger.debug("Response not modified: %s", url)
+                return _copy_response(validator[2])
+
             ## If the response is successful, return the JSON content
-            self.get_logger().debug(f"Request succeeded: {response.status_code}.")
-            return response.json()
+            logger.debug("Request succeeded: %s.", response.status_code)
+            content = response.content
+            if not content:
+                return {}
+            result: Dict
+            if etag_cache is None:
+                result = self.decode_json(content)
+                return result
+
+            ## Skip decoding a body identical to the cached one
+            digest = hashlib.blake2b(content, digest_size=16).digest()
+            if validator is not None and validator[1] == digest:
+                result = validator[2]
+            else:
+                result = self.decode_json(content)
+            etag_cache.set(validator_key, (response.headers.get("ETag"), digest, result))
+            return _copy_response(result)
 
         except requests.exceptions.RequestException as e:
-            self.get_logger().error(f"Request failed: {e}")
+            logger.error("Request failed: %s", e)
+            return {}
+
+        except ValueError as e:
+            logger.error("Failed to decode response: %s", e)
             return {}
 
+    ###################################################################
+    # Core Instance Method: Fetch Page
+    ###################################################################
+    def fetch_page(
+        self,
+        url: str,
+        method: str = "GET",
+        params: Optional[Dict] = None,
+        data: Optional[Dict] = None,
+        json: Optional[Dict] = None,
+        headers: Optional[Dict] = None,
+        authentication: Optional[Any] = None,
+    ) -> Tuple[List[Any], Dict[str, Any]]:
+        """
+        Request one page of a listing endpoint and split it into records and pagination info.
+
+        The response body is decoded once and both views are taken from the same
+        decoded object.
+
+        :param url: Endpoint URL.
+        :param method: HTTP method (default: GET).
+        :param params: Query parameters.
+        :param data: Form data to send.
+        :param json: JSON data to send.
+        :param headers: Additional headers.
+        :param authentication: Override default authentication.
+        :return: Tuple of (records, pagination info).
+        """
+        parsed = self._make_request(
+            url=url,
+            method=method,
+            params=params,
+            data=data,
+            json=json,
+            headers=headers,
+            authentication=authentication,
+        )
+        return self.extract_records(parsed), self.extract_pagination_info(parsed)
+
+    def iter_pages(
+        self,
+        url: str,
+        params: Optional[Dict] = None,
+        page_param: str = "page",
+        start_page: int = 1,
+        **request_kwargs: Any,
+    ) -> Iterator[Tuple[List[Any], Dict[str, Any]]]:
+        """
+        Walk a page-numbered listing endpoint, requesting the next page ahead of the caller.
+
+        The request for page N+1 is sent as soon as page N has arrived, unless the
+        pagination info of page N reports no further pages, so its network round trip
+        overlaps with the caller's processing of page N. Iteration stops on an empty
+        page or on the last reported page.
+
+        :param url: Endpoint URL.
+        :param params: Query parameters shared by every page.
+        :param page_param: Name of the page number query parameter (default: "page").
+        :param start_page: Number of the first page (default: 1).
+        :param request_kwargs: Keyword arguments passed to every fetch_page call.
+        :return: Iterator of (records, pagination info) pairs, one per page.
+        """
+        executor = self.get_executor()
+
+        def request_page(page: int) -> Tuple[List[Any], Dict[str, Any]]:
+            return self.fetch_page(url=url, params={**(params or {}), page_param: page}, **request_kwargs)
+
+        page = start_page
+        pending: Optional[Future] = executor.submit(request_page, page)
+        try:
+            while pending is not None:
+                records, pagination_info = pending.result()
+                if not records:
+                    return
+                # Only request the next page if the listing reports one
+                has_next = self._has_next_page(pagination_info=pagination_info, page=page)
+                pending = executor.submit(request_page, page + 1) if has_next else None
+                yield records, pagination_info
+                page += 1
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+    @staticmethod
+    def _has_next_page(pagination_info: Dict[str, Any], page: int) -> bool:
+        """
+        Decide from the pagination info whether a page follows the given one.
+
+        :param pagination_info: The pagination info of the current page.
+        :param page: The current page number.
+        :return: False if the response reports no further page, True otherwise.
+        """
+        if "has_next" in pagination_info:
+            return bool(pagination_info["has_next"])
+        if "next" in pagination_info:
+            return bool(pagination_info["next"])
+        if "pages" in pagination_info:
+            return bool(page < pagination_info["pages"])
+        return True
+
+    ###################################################################
+    # Core Instance Method: Fetch Multiple
+    ###################################################################
+    def get_executor(self) -> ThreadPoolExecutor:
+        """
+        Get the worker pool used for concurrent requests, creating it on first use.
+
+        Its size is taken from the "max_concurrency" config entry, which bounds the
+        number of requests in flight at once.
+
+        :return: The thread pool executor.
+        """
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.get_config().get("max_concurrency", DEFAULT_MAX_CONCURRENCY),
+                    thread_name_prefix=f"rest-{self.instance_id}",
+                )
+            return self._executor
+
+    def fetch_multiple(self, urls: List[str], method: str = "GET", **request_kwargs: Any) -> List[Dict]:
+        """
+        Request several endpoints concurrently with a bounded number of workers.
+
+        :param urls: Endpoint URLs.
+        :param method: HTTP method (default: GET).
+        :param request_kwargs: Keyword arguments passed to every _make_request call.
+        :return: Response data for each URL, in the same order as urls.
+        """
+        executor = self.get_executor()
+        futures = [executor.submit(self._make_request, url=url, method=method, **request_kwargs) for url in urls]
+        return [future.result() for future in futures]
+
+    def iter_multiple(self, urls: List[str], method: str = "GET", **request_kwargs: Any) -> Iterator[Tuple[str, Dict]]:
+        """
+        Request several endpoints concurrently, yielding each response as soon as it arrives.
+
+        :param urls: Endpoint URLs.
+        :param method: HTTP method (default: GET).
+        :param request_kwargs: Keyword arguments passed to every _make_request call.
+        :return: Iterator of (url, response data) pairs in completion order.
+        """
+        executor = self.get_executor()
+        futures = {executor.submit(self._make_request, url=url, method=method, **request_kwargs): url for url in urls}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
     ###################################################################
     # Core Instance Method: Fetch Data
     ##################################################################
-    def fetch_data(self, data_point: str, return_data_type: type, *args, **kwargs) -> Any:
+    def fetch_data(self, data_point: str, return_data_type: Type[Any], *args: Any, **kwargs: Any) -> Any:
         """
         Base method to fetch data based on the data point and return type.
 
@@ -192,7 +573,7 @@ class RestAPI_DataProvider(DataProvider, ABC):
         :param kwargs: Dict: Keyword arguments for fetching data.
         :return: The fetched data.
         """
-        return super().fetch_data(data_point=data_point, return_data_type=return_data_type, *args, **kwargs)
+        return super().fetch_data(data_point, return_data_type, *args, **kwargs)
 
     ###################################################################
     # Connection Methods
@@ -200,34 +581,164 @@ class RestAPI_DataProvider(DataProvider, ABC):
     def _connect(self) -> None:
         """
         Connect to Aladdin API server.
+
+        With the "share_session" config entry set, instances with the same base URL
+        and retry settings reuse one Session, so they also share its keep-alive
+        connection pool.
+        """
+        if not self.get_config().get("share_session"):
+            self.set_connection(connection=self._create_session())
+            return
+
+        key = self._session_key()
+        with self._shared_sessions_lock:
+            session = self._shared_sessions.get(key)
+            if session is None:
+                session = self._shared_sessions[key] = self._create_session()
+        self.set_connection(connection=session)
+
+    def _create_session(self) -> requests.Session:
+        """
+        Create a Session with the retry strategy and connection pool mounted.
+
+        :return: The new Session.
         """
-        self.set_connection(connection=requests.Session())
+        # Initialize session with retry strategy. The exponential backoff gets a
+        # random jitter of up to "retry_backoff_jitter" seconds (the backoff factor
+        # by default), so clients failing together do not retry in lockstep.
+        config = self.get_config()
+        retry_kwargs = {}
+        if "backoff_jitter" in _RETRY_PARAMETERS:
+            retry_kwargs["backoff_jitter"] = config.get("retry_backoff_jitter", self._retry_backoff_factor)
+            retry_kwargs["backoff_max"] = config.get("retry_backoff_max", DEFAULT_RETRY_BACKOFF_MAX)
+        retry_strategy = Retry(
+            total=self._max_retries,
+            backoff_factor=self._retry_backoff_factor,
+            status_forcelist=config.get("retry_status_codes", DEFAULT_RETRY_STATUS_CODES),
+            allowed_methods=["HEAD", "GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS"],
+            **retry_kwargs,
+        )
+        pool_size = self.get_config().get(
+            "pool_maxsize", max(DEFAULT_POOL_MAXSIZE, self.get_config().get("max_concurrency", 0))
+        )
+        adapter = HTTPAdapter(max_retries=retry_strategy, pool_connections=pool_size, pool_maxsize=pool_size)
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def _session_key(self) -> Tuple:
+        """
+        Get the key identifying the shared Session this instance may use.
+
+        :return: Tuple of the settings the Session is built from.
+        """
+        config = self.get_config()
+        return (
+            type(self),
+            self._base_url,
+            self._max_retries,
+            self._retry_backoff_factor,
+            config.get("retry_backoff_jitter"),
+            config.get("retry_backoff_max"),
+            tuple(config.get("retry_status_codes", DEFAULT_RETRY_STATUS_CODES)),
+        )
 
     def _disconnect(self, *args, **kwargs):
+        self._shutdown_executor()
         if self.get_connection() is not None:
-            self.get_connection().close()
+            # A shared Session stays open for the other instances using it
+            if not self.get_config().get("share_session"):
+                self.get_connection().close()
             self.set_connection(connection=None)
 
     ###################################################################
     # Utility Methods
     ###################################################################
     @staticmethod
-    def generate_headers(*args, **kwargs) -> Dict:
+    def decode_json(content: bytes) -> Any:
+        """
+        Decode a JSON response body, using orjson when it is installed.
+
+        :param content: The raw response body.
+        :return: The decoded JSON data.
+        :raises ValueError: If the body is not valid JSON.
+        """
+        if orjson is not None:
+            return orjson.loads(content)
+        return jsonlib.loads(content)
+
+    @staticmethod
+    def extract_records(parsed: Any) -> List[Any]:
+        """
+        Extract the list of records from a decoded response.
+
+        :param parsed: The decoded JSON response.
+        :return: The records: the response itself if it is a list, else the first list
+                 found under "results", "items", "data" or "content", else the response
+                 wrapped in a list.
+        """
+        if isinstance(parsed, list):
+            return parsed
+        if not parsed:
+            return []
+        for key in _DATA_KEYS:
+            records = parsed.get(key)
+            if isinstance(records, list):
+                return records
+        return [parsed]
+
+    @staticmethod
+    def extract_pagination_info(parsed: Any) -> Dict[str, Any]:
+        """
+        Extract the pagination fields from a decoded response.
+
+        :param parsed: The decoded JSON response.
+        :return: Dictionary of the pagination fields present, with the total number
+                 of items under "total" when the response reports one.
+        """
+        if not isinstance(parsed, dict):
+            return {}
+        pagination_info = {key: parsed[key] for key in _PAGINATION_FIELDS.intersection(parsed)}
+        for key in _TOTAL_KEYS:
+            if key in parsed:
+                pagination_info["total"] = parsed[key]
+                break
+        return pagination_info
+
+    @staticmethod
+    def encode_json(payload: Any) -> bytes:
+        """
+        Encode a request body as JSON, using orjson when it is installed.
+
+        Callers sending the same payload repeatedly can encode it once and pass
+        the bytes as the json argument.
+
+        :param payload: The object to encode.
+        :return: The encoded JSON body.
+        :raises TypeError: If the payload is not JSON serializable.
+        """
+        if orjson is not None:
+            encoded: bytes = orjson.dumps(payload)
+            return encoded
+        return jsonlib.dumps(payload, allow_nan=False).encode("utf-8")
+
+    @staticmethod
+    def generate_headers(*args: Any, headers: Optional[Dict] = None, **kwargs: Any) -> Dict:
         """
         Generate default HTTP headers for API requests.
+
+        The defaults are copied from a module-level template in one step, with any
+        overrides merged in the same step.
         
         :param args: Additional positional arguments (unused).
+        :param headers: Headers overriding or extending the defaults.
         :param kwargs: Additional keyword arguments (unused).
         :return: Dictionary containing default HTTP headers.
         """
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-            "Accept": "application/json, text/plain, */*",
-            "Accept-Language": "en-US,en;q=0.9",
-            "Content-Type": "application/json",
-            "Connection": "keep-alive",
-        }
-        return headers
+        if headers:
+            return {**_DEFAULT_HEADERS, **headers}
+        return dict(_DEFAULT_HEADERS)
     
     def generate_authentication(self, authentication_type: str, *args, **kwargs) -> Any:
         """
@@ -15,6 +15,7 @@ import datetime
 import logging
 from abc import ABC, abstractmethod
 from typing import (
+    ClassVar,
     Dict,
     List,
     Optional,
@@ -38,8 +39,10 @@ class Forex_DataProvider_Base(DataProvider, ABC):
     #################################################
     # Class Attributes
     #################################################
-    __name: str = "Forex_DataProvider_Base"
-    __type: str = "DataProvider"
+    name: ClassVar[str] = "Forex_DataProvider_Base"
+    type: ClassVar[str] = "DataProvider"
+
+    __slots__ = ()
 
     #################################################
     # Constructor
@@ -83,14 +86,14 @@ class Forex_DataProvider_Base(DataProvider, ABC):
         """
         Connect to the data source.
         """
-        raise NotImplementedError("Subclasses must implement this method")
+        ...
     
     @abstractmethod
     def _disconnect(self) -> None:
         """
         Disconnect from the data source.
         """
-        raise NotImplementedError("Subclasses must implement this method")
+        ...
 
     #################################################
     # Core Instance Methods
@@ -113,7 +116,7 @@ class Forex_DataProvider_Base(DataProvider, ABC):
         :param kwargs: Additional keyword arguments.
         :return: The exchange rate as a float.
         """
-        raise NotImplementedError("Subclasses must implement this method")
+        ...
     
     @abstractmethod
     def get_exchange_rates_historical(
@@ -136,5 +139,5 @@ class Forex_DataProvider_Base(DataProvider, ABC):
         :param kwargs: Additional keyword arguments.
         :return: A dictionary mapping dates to exchange rates.
         """
-        raise NotImplementedError("Subclasses must implement this method")
+        ...
 
@@ -15,6 +15,7 @@ import datetime
 import logging
 from typing import (
     Any,
+    ClassVar,
     Dict, 
     List, 
     Optional,
@@ -42,17 +43,19 @@ class Forex_DataProvider_Wrapper(DataProvider_Wrapper):
     #################################################
     # Class Attributes
     #################################################
-    __name: str = "Forex_DataProvider_Wrapper"
-    __type: str = "DataProvider_Wrapper"
-    __valid_data_sources = [
+    name: ClassVar[str] = "Forex_DataProvider_Wrapper"
+    type: ClassVar[str] = "DataProvider_Wrapper"
+    valid_data_sources: ClassVar[List[str]] = [
         "forex-python",
         "exchange_rate_api",
     ]
-    __valid_data_source_mapping = {
+    valid_data_source_mapping: ClassVar[Dict[str, Any]] = {
         "forex-python": ForexPython_DataProvider,
         "exchange_rate_api": None,
     }
 
+    __slots__ = ()
+
     #################################################
     # Constructor
     #################################################
@@ -79,8 +82,8 @@ class Forex_DataProvider_Wrapper(DataProvider_Wrapper):
             instance_id=instance_id,
             logger=logger,
             log_level=log_level,
-            valid_data_sources=self.__valid_data_sources,
-            valid_data_source_mapping=self.__valid_data_source_mapping,
+            valid_data_sources=self.valid_data_sources,
+            valid_data_source_mapping=self.valid_data_source_mapping,
             **config,
         )
 
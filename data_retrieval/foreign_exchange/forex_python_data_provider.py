@@ -14,9 +14,12 @@
 import datetime
 import logging
 from typing import (
+    Any,
+    ClassVar,
     Dict,
     List,
     Optional,
+    Tuple,
     Union,
 )
 
@@ -41,8 +44,10 @@ class ForexPython_DataProvider(Forex_DataProvider_Base):
     #################################################
     # Class Attributes
     #################################################
-    __name: str = "ForexPython_DataProvider"
-    __type: str = "DataProvider"
+    name: ClassVar[str] = "ForexPython_DataProvider"
+    type: ClassVar[str] = "DataProvider"
+
+    __slots__ = ()
 
     #################################################
     # Constructor
@@ -69,6 +74,9 @@ class ForexPython_DataProvider(Forex_DataProvider_Base):
             log_level=log_level,
             **config
         )
+
+        # Spot rates sharing a base currency and date are fetched in one request
+        self.add_batch_data_method("exchange_rate_on_spot", self.get_exchange_rates_on_spot)
         
         # Connect to the data source
         self.connect()
@@ -121,6 +129,35 @@ class ForexPython_DataProvider(Forex_DataProvider_Base):
         # Get the exchange rate
         return currency_rates.get_rate(base_cur=base_currency, dest_cur=target_currency, date_obj=fx_datetime)
     
+    def get_exchange_rates_on_spot(
+        self,
+        currency_pairs: List[Tuple],
+        *args: Any,
+        **kwargs: Any,
+    ) -> List[Optional[float]]:
+        """
+        Get the exchange rates for many currency pairs, with one request per base currency and date.
+
+        :param currency_pairs: The (base_currency, target_currency) or (base_currency, target_currency, fx_datetime) tuples.
+        :param args: Additional positional arguments.
+        :param kwargs: Additional keyword arguments.
+        :return: The exchange rates, one per currency pair, in order.
+        """
+        # Get the connection
+        currency_rates = self.get_connection().get("currency_rates")
+
+        # Get all the rates of each base currency and date once
+        raw_records = {}
+        exchange_rates = []
+        for base_currency, target_currency, *rest in currency_pairs:
+            fx_datetime = rest[0] if rest else None
+            key = (base_currency, fx_datetime)
+            if key not in raw_records:
+                raw_records[key] = currency_rates.get_rates(base_cur=base_currency, date_obj=fx_datetime)
+            exchange_rates.append(raw_records[key].get(target_currency, None))
+
+        return exchange_rates
+
     def get_exchange_rates_historical(
         self,
         base_currency: str, 
@@ -0,0 +1,287 @@
+#######################################################################
+# Project: Data Retrieval Module
+# File: connection_pool.py
+# Description: Thread-safe pool of reusable data source connections
+# Author: AbigailWilliams1692
+# Created: 2026-10-15
+# Updated: 2026-10-15
+#######################################################################
+
+#######################################################################
+# Import Packages
+#######################################################################
+# Standard Packages
+import threading
+import time
+import weakref
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Deque, Dict, Hashable, Iterator, List, Optional, Tuple
+
+
+#######################################################################
+# Connection Pool Class
+#######################################################################
+class ConnectionPool:
+    """
+    Thread-safe pool of connections created on demand up to a maximum size.
+
+    Released connections are kept idle and handed out again, most recently used
+    first, so callers skip the cost of opening a new connection. Idle connections
+    unused for longer than idle_timeout are closed on the next acquire() or
+    release(), keeping at least min_size of them open. When every connection is
+    in use, acquire() waits for one to be released.
+    """
+
+    #################################################
+    # Class Attributes
+    #################################################
+    # Pools shared between providers, dropped once no provider references them
+    _shared_pools: "weakref.WeakValueDictionary[Hashable, ConnectionPool]" = weakref.WeakValueDictionary()
+    _shared_pools_lock = threading.Lock()
+
+    #################################################
+    # Constructor
+    #################################################
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        closer: Optional[Callable[[Any], None]] = None,
+        min_size: int = 0,
+        max_size: int = 10,
+        idle_timeout: float = 300.0,
+    ) -> None:
+        """
+        Initialize the pool.
+
+        :param factory: Callable opening a new connection.
+        :param closer: Callable closing a connection, defaulting to its close() method.
+        :param min_size: Number of idle connections kept open regardless of idle_timeout.
+        :param max_size: Maximum number of connections open at once.
+        :param idle_timeout: Number of seconds an idle connection is kept before being closed.
+        """
+        if max_size < 1 or min_size < 0 or min_size > max_size:
+            raise ValueError(f"Invalid pool sizes: min_size={min_size}, max_size={max_size}.")
+
+        self._factory = factory
+        self._closer = closer or (lambda connection: connection.close())
+        self._min_size = min_size
+        self._max_size = max_size
+        self._idle_timeout = idle_timeout
+        ## Idle connections as (connection, last used monotonic time), oldest first
+        self._idle: Deque[Tuple[Any, float]] = deque()
+        ## Number of connections open, idle or in use
+        self._size = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        ## Close the idle connections when the pool is garbage collected
+        self._finalizer = weakref.finalize(self, ConnectionPool._close_connections, self._idle, self._closer)
+
+    @classmethod
+    def shared(cls, key: Hashable, factory: Callable[[], Any], **kwargs: Any) -> "ConnectionPool":
+        """
+        Get the pool shared under a key, creating it on first use.
+
+        :param key: Hashable key identifying the connection settings, e.g. (provider class, database).
+        :param factory: Callable opening a new connection, used if the pool is created.
+        :param kwargs: Additional ConnectionPool arguments, used if the pool is created.
+        :return: The shared pool.
+        """
+        with cls._shared_pools_lock:
+            pool = cls._shared_pools.get(key)
+            if pool is None or pool.is_closed():
+                pool = cls(factory, **kwargs)
+                cls._shared_pools[key] = pool
+            return pool
+
+    #################################################
+    # Getter Methods
+    #################################################
+    def get_min_size(self) -> int:
+        """
+        Get the number of idle connections kept open regardless of idle_timeout.
+
+        :return: The minimum pool size.
+        """
+        return self._min_size
+
+    def get_max_size(self) -> int:
+        """
+        Get the maximum number of connections open at once.
+
+        :return: The maximum pool size.
+        """
+        return self._max_size
+
+    def get_idle_timeout(self) -> float:
+        """
+        Get the number of seconds an idle connection is kept.
+
+        :return: The idle timeout in seconds.
+        """
+        return self._idle_timeout
+
+    def is_closed(self) -> bool:
+        """
+        Check if the pool has been closed.
+
+        :return: True if closed, False otherwise.
+        """
+        return self._closed
+
+    #################################################
+    # Core Instance Methods
+    #################################################
+    def acquire(self, timeout: Optional[float] = None) -> Any:
+        """
+        Take an idle connection, or open a new one while below max_size.
+
+        :param timeout: Maximum number of seconds to wait for a connection, or None to wait indefinitely.
+        :return: The connection.
+        :raises TimeoutError: If no connection became available within the timeout.
+        :raises RuntimeError: If the pool is closed.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            expired = self._pop_expired()
+            while True:
+                if self._closed:
+                    raise RuntimeError("Connection pool is closed.")
+                if self._idle:
+                    connection, _ = self._idle.pop()
+                    break
+                if self._size < self._max_size:
+                    self._size += 1
+                    connection = None
+                    break
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError(f"No connection available within {timeout} seconds.")
+                self._condition.wait(remaining)
+        self._close_all(expired)
+
+        # Open the new connection outside the lock
+        if connection is None:
+            try:
+                connection = self._factory()
+            except BaseException:
+                with self._condition:
+                    self._size -= 1
+                    self._condition.notify()
+                raise
+        return connection
+
+    def release(self, connection: Any) -> None:
+        """
+        Return a connection to the pool.
+
+        :param connection: The connection taken by acquire().
+        :return: None.
+        """
+        with self._condition:
+            if self._closed:
+                self._size -= 1
+                expired = [connection]
+            else:
+                self._idle.append((connection, time.monotonic()))
+                expired = self._pop_expired()
+                self._condition.notify()
+        self._close_all(expired)
+
+    def discard(self, connection: Any) -> None:
+        """
+        Close a broken connection instead of returning it to the pool.
+
+        :param connection: The connection taken by acquire().
+        :return: None.
+        """
+        with self._condition:
+            self._size -= 1
+            self._condition.notify()
+        self._close_all([connection])
+
+    @contextmanager
+    def connection(self, timeout: Optional[float] = None) -> Iterator[Any]:
+        """
+        Borrow a connection for the duration of a with block.
+
+        :param timeout: Maximum number of seconds to wait for a connection, or None to wait indefinitely.
+        :return: Iterator yielding the connection.
+        """
+        connection = self.acquire(timeout=timeout)
+        try:
+            yield connection
+        finally:
+            self.release(connection)
+
+    def close(self) -> None:
+        """
+        Close the idle connections. Connections in use are closed when released.
+
+        :return: None.
+        """
+        with self._condition:
+            self._closed = True
+            self._size -= len(self._idle)
+            self._condition.notify_all()
+        self._finalizer()
+
+    def info(self) -> Dict[str, Any]:
+        """
+        Get the pool statistics.
+
+        :return: Dictionary with size, idle, in_use, min_size and max_size.
+        """
+        with self._condition:
+            return {
+                "size": self._size,
+                "idle": len(self._idle),
+                "in_use": self._size - len(self._idle),
+                "min_size": self._min_size,
+                "max_size": self._max_size,
+            }
+
+    #################################################
+    # Helper Methods
+    #################################################
+    def _pop_expired(self) -> List[Any]:
+        """
+        Remove the idle connections past idle_timeout, keeping min_size of them. Call with the lock held.
+
+        :return: List of removed connections, to be closed outside the lock.
+        """
+        expired = []
+        cutoff = time.monotonic() - self._idle_timeout
+        while len(self._idle) > self._min_size and self._idle[0][1] < cutoff:
+            expired.append(self._idle.popleft()[0])
+        self._size -= len(expired)
+        return expired
+
+    def _close_all(self, connections: List[Any]) -> None:
+        """
+        Close connections, ignoring the errors of connections that are already broken.
+
+        :param connections: The connections to close.
+        :return: None.
+        """
+        for connection in connections:
+            try:
+                self._closer(connection)
+            except Exception:
+                pass
+
+    @staticmethod
+    def _close_connections(idle: Deque[Tuple[Any, float]], closer: Callable[[Any], None]) -> None:
+        """
+        Close and remove every idle connection.
+
+        :param idle: The idle connections of a pool.
+        :param closer: Callable closing a connection.
+        :return: None.
+        """
+        while idle:
+            connection, _ = idle.popleft()
+            try:
+                closer(connection)
+            except Exception:
+                pass
@@ -11,13 +11,39 @@
 # Import Packages
 #######################################################################
 # Standard Packages
+import functools
 import logging
+import sys
 from abc import ABC
-from typing import Any, Optional
+from typing import Any, ClassVar, Optional, Tuple
 
 # Local Packages
 
 
+#################################################
+# Helper Functions
+#################################################
+@functools.lru_cache(maxsize=None)
+def _get_logger(name: str) -> logging.Logger:
+    """
+    Get the logger with the given name, looking it up in the logging manager only once.
+
+    :param name: str: Name of the logger.
+    :return: logging.Logger: The logger.
+    """
+    return logging.getLogger(name)
+
+
+def _intern_id(instance_id: Any) -> Any:
+    """
+    Intern string instance ids, so that repeated ids share one object and compare by identity.
+
+    :param instance_id: Any: The instance id.
+    :return: Any: The interned id, or the id unchanged if it is not a string.
+    """
+    return sys.intern(instance_id) if type(instance_id) is str else instance_id
+
+
 #################################################
 # Class Definition
 #################################################
@@ -29,8 +55,26 @@ class DataModule(ABC):
     #################################################
     # Class Attributes
     #################################################
-    __name: str = "BaseDataModule"
-    __type: str = "DataModule"
+    name: ClassVar[str] = "BaseDataModule"
+    type: ClassVar[str] = "DataModule"
+
+    # Logger named after the class, looked up once when the class is created
+    _default_logger: ClassVar[logging.Logger] = _get_logger("DataModule")
+
+    # Instance attributes are stored in slots rather than a per-instance __dict__
+    __slots__ = ("_instance_id", "_log_level", "_logger", "_status", "_signature", "__weakref__")
+
+    #################################################
+    # Subclass Hook
+    #################################################
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """
+        Look up the default logger of every subclass when the class is created.
+
+        :param kwargs: Keyword arguments forwarded to the parent hook.
+        """
+        super().__init_subclass__(**kwargs)
+        cls._default_logger = _get_logger(cls.__name__)
 
     #################################################
     # Constructor
@@ -47,14 +91,17 @@ class DataModule(ABC):
         :param instance_id: str: Unique identifier for the data module instance.
         :param logger: logging.Logger: Logger instance for logging.
         """
-        # DataProvider ID
-        self._instance_id = instance_id or id(self)
+        # DataProvider ID, interned when given as a string
+        self._instance_id = _intern_id(instance_id) if instance_id else id(self)
+
+        # (name, type, instance_id) key for registries, rebuilt when the id changes
+        self._signature = (type(self).name, type(self).type, self._instance_id)
 
         # Log Level
         self._log_level = log_level
 
-        # Logger
-        self._logger = logger or self.refresh_logger()
+        # Logger, resolved on first use when not given
+        self._logger = logger
 
         # Status
         self._status = None
@@ -68,7 +115,7 @@ class DataModule(ABC):
 
         :return: str: Name of the data module.
         """
-        return self.__name
+        return type(self).name
 
     def get_type(self) -> str:
         """
@@ -76,7 +123,7 @@ class DataModule(ABC):
 
         :return: str: Type of the data module.
         """
-        return self.__type
+        return type(self).type
 
     def get_instance_id(self) -> str:
         """
@@ -92,7 +139,16 @@ class DataModule(ABC):
 
         :param instance_id: str: Unique identifier of the data module instance.
         """
-        self._instance_id = instance_id
+        self._instance_id = _intern_id(instance_id)
+        self._signature = (type(self).name, type(self).type, self._instance_id)
+
+    def get_signature(self) -> Tuple[str, str, Any]:
+        """
+        Get the (name, type, instance_id) tuple identifying the data module instance.
+
+        :return: Tuple[str, str, Any]: Signature of the data module instance.
+        """
+        return self._signature
 
     def get_logger(self) -> logging.Logger:
         """
@@ -100,6 +156,8 @@ class DataModule(ABC):
 
         :return: logging.Logger: Logger instance.
         """
+        if self._logger is None:
+            self._logger = self.refresh_logger()
         return self._logger
 
     def set_logger(self, logger: logging.Logger) -> None:
@@ -114,8 +172,9 @@ class DataModule(ABC):
         """
         Refresh the logger instance.
         """
-        logger = logging.getLogger(name=self.__class__.__name__)
-        logger.setLevel(self._log_level)
+        logger = type(self)._default_logger
+        if self._log_level is not None and logger.level != self._log_level:
+            logger.setLevel(self._log_level)
         return logger
 
     def get_log_level(self) -> int:
@@ -130,9 +189,16 @@ class DataModule(ABC):
         """
         Set the log level of the logger instance.
 
+        The logger is compared with its own level rather than the recorded one,
+        since it may be shared with other instances or have been passed in at
+        another level.
+
         :param log_level: int: Log level of the logger instance.
         """
-        self._logger.setLevel(level=log_level)
+        self._log_level = log_level
+        logger = self._logger
+        if logger is not None and logger.level != log_level:
+            logger.setLevel(level=log_level)
 
     def get_status(self) -> Any:
         """Get the preoccupation status of the data module.
@@ -148,3 +214,51 @@ class DataModule(ABC):
         :param status: Any: Preoccupation status of the data module.
         """
         self._status = status
+
+    #################################################
+    # Properties
+    #################################################
+    @property
+    def instance_id(self) -> Any:
+        """
+        Unique identifier of the data module instance.
+        """
+        return self._instance_id
+
+    @instance_id.setter
+    def instance_id(self, instance_id: Any) -> None:
+        self._instance_id = _intern_id(instance_id)
+        self._signature = (type(self).name, type(self).type, self._instance_id)
+
+    @property
+    def logger(self) -> logging.Logger:
+        """
+        Logger instance.
+        """
+        return self.get_logger()
+
+    @logger.setter
+    def logger(self, logger: logging.Logger) -> None:
+        self._logger = logger
+
+    @property
+    def log_level(self) -> Optional[int]:
+        """
+        Log level of the logger instance.
+        """
+        return self._log_level
+
+    @log_level.setter
+    def log_level(self, log_level: int) -> None:
+        self.set_log_level(log_level)
+
+    @property
+    def status(self) -> Any:
+        """
+        Preoccupation status of the data module.
+        """
+        return self._status
+
+    @status.setter
+    def status(self, status: Any) -> None:
+        self._status = status
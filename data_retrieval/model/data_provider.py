@@ -12,18 +12,29 @@
 #######################################################################
 # Standard Packages
 import logging
+import threading
 from abc import abstractmethod
-from collections.abc import Callable
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from enum import Enum
 from typing import (
     Any,
+    Deque,
+    Iterable,
+    List,
     Optional,
+    ClassVar,
     Dict,
     Callable,
+    FrozenSet,
+    Tuple,
+    Type,
 )
 
 # Local Packages
 from data_retrieval.model.data_module import DataModule
+from data_retrieval.utils.cache_utils import TTLCache
 from data_retrieval.model.exceptions import (
     DataProviderConnectionError,
     DataMethodNotFoundError,
@@ -31,6 +42,51 @@ from data_retrieval.model.exceptions import (
 )
 
 
+#######################################################################
+# Constants
+#######################################################################
+# Return data types that accept any data, for which the type check is skipped
+_ANY_DATA_TYPES = (object, Any)
+
+# Marker for fetch cache misses, since None is a valid cached result
+_MISSING = object()
+
+# Number of fetch_data calls fetch_data_concurrent runs at once by default,
+# and size of the default worker pool, overridable via the "max_concurrency"
+# config entry
+DEFAULT_CONCURRENCY_LIMIT = 32
+
+
+#######################################################################
+# Helper Functions
+#######################################################################
+def _key_to_args(key: Any) -> Tuple:
+    """
+    Convert a fetch_data_many() key into the positional arguments of its data method.
+
+    :param key: A tuple of positional arguments, or a single positional argument.
+    :return: The positional arguments.
+    """
+    return key if type(key) is tuple else (key,)
+
+
+def _fetch_cache_key(data_point: str, args: Tuple, kwargs: Dict[str, Any]) -> Optional[Tuple]:
+    """
+    Build the fetch cache key of a fetch_data() call.
+
+    :param data_point: The data point to fetch.
+    :param args: Positional arguments of the call.
+    :param kwargs: Keyword arguments of the call.
+    :return: The cache key, or None if an argument is not hashable.
+    """
+    key = (data_point, args, tuple(sorted(kwargs.items())) if kwargs else ())
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
 #######################################################################
 # Enums & Data Classes
 #######################################################################
@@ -58,8 +114,19 @@ class DataProvider(DataModule):
     #################################################
     # Class Attributes
     #################################################
-    __name: str = "DataProvider"
-    __type: str = "DataProvider"
+    name: ClassVar[str] = "DataProvider"
+    type: ClassVar[str] = "DataProvider"
+
+    __slots__ = (
+        "_config",
+        "_connection",
+        "_data_methods",
+        "_batch_data_methods",
+        "_fetch_cache",
+        "_cached_data_points",
+        "_executor",
+        "_executor_lock",
+    )
 
     #################################################
     # Constructor
@@ -90,6 +157,11 @@ class DataProvider(DataModule):
         self._config = config or {}
         self._connection = None
         self._data_methods = {}
+        self._batch_data_methods: Dict[str, Callable] = {}
+        self._fetch_cache: Optional[TTLCache] = None
+        self._cached_data_points: FrozenSet[str] = frozenset()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
         
         # Set initial status for the DataProvider instance
         self.set_status(DataProviderConnectionStatus.DISCONNECTED)
@@ -190,6 +262,27 @@ class DataProvider(DataModule):
             }
         )
 
+    def get_batch_data_method(self, data_point: str) -> Optional[Callable]:
+        """
+        Get the batch data method of a data point.
+
+        :param data_point: The name of the data method.
+        :return: The batch data method, or None if the data point has none.
+        """
+        return self._batch_data_methods.get(data_point)
+
+    def add_batch_data_method(self, data_point: str, method: Callable) -> None:
+        """
+        Add a batch data method, used by fetch_data_many() to fetch many keys of a data point at once.
+
+        The method is called as method(keys, **kwargs) and returns one result per key, in order.
+
+        :param data_point: The name of the data method.
+        :param method: The batch data method.
+        :return: None.
+        """
+        self._batch_data_methods[data_point] = method
+
     def delete_data_method(self, data_point: str) -> None:
         """
         Delete a data method from the data methods dictionary.
@@ -231,7 +324,7 @@ class DataProvider(DataModule):
         """
         Abstract method to connect to the data source.
         """
-        raise NotImplementedError("Subclasses must implement this method")
+        ...
 
     def disconnect(self, *args, **kwargs) -> None:
         """
@@ -244,6 +337,7 @@ class DataProvider(DataModule):
         """
         try:
             self._disconnect(*args, **kwargs)
+            self._shutdown_executor()
             self.set_status(status=DataProviderConnectionStatus.DISCONNECTED)
         except Exception as e:
             raise DataProviderConnectionError(f"Failed to disconnect from data source: {e}")
@@ -253,7 +347,7 @@ class DataProvider(DataModule):
         """
         Abstract method to disconnect from the data source.
         """
-        raise NotImplementedError("Subclasses must implement this method")
+        ...
             
     def refresh_connection(self, *args, **kwargs) -> None:
         """
@@ -268,6 +362,37 @@ class DataProvider(DataModule):
         self.connect(*args, **kwargs)
 
     
+    #################################################
+    # Worker Pool Methods
+    #################################################
+    def get_executor(self) -> ThreadPoolExecutor:
+        """
+        Get the worker pool used for concurrent fetches, creating it on first use.
+
+        Its size is taken from the "max_concurrency" config entry. Subclasses
+        override this to size the pool for their data source.
+
+        :return: The thread pool executor.
+        """
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.get_config().get("max_concurrency", DEFAULT_CONCURRENCY_LIMIT),
+                    thread_name_prefix=f"{self.name}-{self.instance_id}",
+                )
+            return self._executor
+
+    def _shutdown_executor(self) -> None:
+        """
+        Stop the worker pool, waiting for the running tasks to finish.
+
+        :return: None.
+        """
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
     #################################################
     # Context Management
     #################################################
@@ -275,6 +400,8 @@ class DataProvider(DataModule):
         """
         Enter the runtime context related to this object. Automatically connects to the data source.
         """
+        if not self.is_connected():
+            self.connect()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
@@ -283,30 +410,183 @@ class DataProvider(DataModule):
         """
         self.disconnect()
 
+    #################################################
+    # Fetch Cache Methods
+    #################################################
+    def enable_cache(self, data_points: Iterable[str], maxsize: int = 1024, ttl: float = 60.0) -> None:
+        """
+        Memoize the fetch_data() results of the given data points, keyed by data point and arguments.
+
+        Only list read-only data points whose results do not change within the
+        TTL; other data points, such as writes, are always executed. Calls with
+        unhashable arguments and results that are iterators or generators are
+        not cached. Cached results are shared between callers, so they must not
+        be mutated.
+
+        :param data_points: The data points whose results are memoized.
+        :param maxsize: Maximum number of cached results; the least recently used one is evicted first.
+        :param ttl: Number of seconds a result stays cached.
+        :return: None.
+        """
+        self._cached_data_points = frozenset(data_points)
+        self._fetch_cache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def disable_cache(self) -> None:
+        """
+        Stop memoizing fetch_data() results and drop the cached ones.
+
+        :return: None.
+        """
+        self._fetch_cache = None
+        self._cached_data_points = frozenset()
+
+    def invalidate_cache(self, data_point: Optional[str] = None) -> int:
+        """
+        Drop the cached results of a data point, or every cached result.
+
+        :param data_point: The data point whose results are dropped, or None for all.
+        :return: Number of results dropped.
+        """
+        if self._fetch_cache is None:
+            return 0
+        if data_point is None:
+            return self._fetch_cache.invalidate()
+        return self._fetch_cache.invalidate(lambda key, value: isinstance(key, tuple) and key[0] == data_point)
+
+    def get_cache_info(self) -> Optional[Dict[str, Any]]:
+        """
+        Get the fetch cache statistics.
+
+        :return: Dictionary of cache statistics, or None if caching is disabled.
+        """
+        return self._fetch_cache.info() if self._fetch_cache is not None else None
+
     #################################################
     # Core Instance Method: Fetch Data
     #################################################
-    def fetch_data(self, data_point: str, return_data_type: type, *args, **kwargs) -> Any:
+    def fetch_data(self, data_point: str, return_data_type: Type[Any], *args: Any, **kwargs: Any) -> Any:
         """
         Base method to fetch data based on the data point and return type.
 
         :param data_point: str: The data point to fetch.
-        :param return_data_type: type: The type of data to return.
+        :param return_data_type: type: The type of data to return. Passing object or Any skips the check.
         :param args: Tuple: Positional arguments for fetching data.
         :param kwargs: Dict: Keyword arguments for fetching data.
         :return: The fetched data.
         """
         # Extract the corresponding data method
-        data_method = self.get_data_method(data_point=data_point)
+        data_method = self._data_methods.get(data_point)
         if data_method is None:
             raise DataMethodNotFoundError(f"Data method for data point '{data_point}' not found.")
         
-        # Retrieve the data
-        data = data_method(*args, **kwargs)
-
-        # Check the return data type
+        # Retrieve the data, from the fetch cache when enabled for the data point
+        cache = self._fetch_cache
+        if cache is None or data_point not in self._cached_data_points:
+            data = data_method(*args, **kwargs)
+        else:
+            cache_key = _fetch_cache_key(data_point, args, kwargs)
+            data = cache.get(cache_key, _MISSING) if cache_key is not None else _MISSING
+            if data is _MISSING:
+                data = data_method(*args, **kwargs)
+                ## Iterators can only be consumed once, so they are never cached
+                if cache_key is not None and not isinstance(data, Iterator):
+                    cache.set(cache_key, data)
+
+        # Check the return data type, unless any type is accepted
+        if return_data_type in _ANY_DATA_TYPES:
+            return data
         if not isinstance(data, return_data_type):
             raise ReturnDataTypeNotMatchedError(f"Data type mismatch. Expected {return_data_type}, got {type(data)}.")
         
         return data
 
+    def fetch_data_many(
+        self,
+        data_point: str,
+        return_data_type: Type[Any],
+        keys: Iterable[Any],
+        batch_size: Optional[int] = None,
+        **kwargs: Any,
+    ) -> List[Any]:
+        """
+        Fetch a data point for many keys.
+
+        Each key is a tuple of positional arguments for the data method, or a single
+        positional argument. When the data point has a batch data method, the keys
+        are sent in chunks of batch_size (all at once by default), turning one round
+        trip per key into one per chunk. Otherwise this falls back to calling
+        fetch_data() once per key. Batching keeps memory bounded by the chunk size,
+        whereas fetch_data calls spread over threads overlap the round trips but
+        load the source with as many parallel requests.
+
+        :param data_point: str: The data point to fetch.
+        :param return_data_type: type: The type of each result. Passing object or Any skips the check.
+        :param keys: Iterable: The keys to fetch.
+        :param batch_size: int: Maximum number of keys per batch call.
+        :param kwargs: Dict: Keyword arguments passed to every call.
+        :return: The results, one per key, in order.
+        """
+        batch_method = self._batch_data_methods.get(data_point)
+        if batch_method is None:
+            return [self.fetch_data(data_point, return_data_type, *_key_to_args(key), **kwargs) for key in keys]
+
+        # Fetch the keys chunk by chunk
+        keys = list(keys)
+        size = batch_size or len(keys) or 1
+        results = []
+        for start in range(0, len(keys), size):
+            results.extend(batch_method(keys[start:start + size], **kwargs))
+
+        # Check the return data types, unless any type is accepted
+        if return_data_type not in _ANY_DATA_TYPES:
+            for data in results:
+                if not isinstance(data, return_data_type):
+                    raise ReturnDataTypeNotMatchedError(
+                        f"Data type mismatch. Expected {return_data_type}, got {type(data)}."
+                    )
+
+        return results
+
+    def fetch_data_concurrent(
+        self,
+        calls: List[Dict[str, Any]],
+        limit: int = DEFAULT_CONCURRENCY_LIMIT,
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """
+        Run many fetch_data() calls on the provider's worker pool, at most limit at a time.
+
+        Each call is a dictionary of fetch_data() keyword arguments, e.g.
+        {"data_point": "fetch_page", "return_data_type": dict, "url": "items"}.
+        Overlapping the round trips brings N calls down to about ceil(N / limit)
+        round trips for sources without a batch data method; unlike
+        fetch_data_many() batches, it puts limit parallel requests on the source.
+        The calls share the worker pool of get_executor(), so data points that
+        themselves wait on that pool (e.g. fetch_parallel) must not be run here.
+
+        :param calls: List of fetch_data() keyword argument dictionaries.
+        :param limit: Maximum number of calls running at once.
+        :param return_exceptions: Return the exception of a failed call in its place instead of raising it.
+        :return: The results, one per call, in order.
+        """
+        if not calls:
+            return []
+
+        def outcome(future: "Future[Any]") -> Any:
+            return (future.exception() or future.result()) if return_exceptions else future.result()
+
+        # Keep at most limit calls submitted, collecting the results in call order
+        executor = self.get_executor()
+        pending: Deque["Future[Any]"] = deque()
+        results: List[Any] = []
+        try:
+            for call in calls:
+                if len(pending) >= limit:
+                    results.append(outcome(pending.popleft()))
+                pending.append(executor.submit(self.fetch_data, **call))
+            while pending:
+                results.append(outcome(pending.popleft()))
+        finally:
+            for future in pending:
+                future.cancel()
+        return results
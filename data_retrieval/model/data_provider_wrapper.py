@@ -15,7 +15,9 @@ import logging
 from typing import (
     Any,
     Optional,
+    ClassVar,
     Dict,
+    Iterable,
     List,
     Type,
 )
@@ -57,8 +59,17 @@ class DataProvider_Wrapper(DataModule):
     #################################################
     # Class Attributes
     #################################################
-    __name: str = "DataProvider_Wrapper"
-    __type: str = "DataProvider_Wrapper"
+    name: ClassVar[str] = "DataProvider_Wrapper"
+    type: ClassVar[str] = "DataProvider_Wrapper"
+
+    __slots__ = (
+        "_valid_data_sources",
+        "_valid_data_source_mapping",
+        "_config",
+        "_data_source",
+        "_data_providers",
+        "_data_provider",
+    )
 
     #################################################
     # Constructor
@@ -90,14 +101,16 @@ class DataProvider_Wrapper(DataModule):
         )
 
         # Initialize DataProvider_Wrapper attributes
-        ## Valid data sources and mappings
-        self.__valid_data_sources = valid_data_sources
-        self.__valid_data_source_mapping = valid_data_source_mapping
+        ## Valid data sources and mappings, copied so that registering a data
+        ## source on one wrapper does not leak into class-level defaults
+        self._valid_data_sources = list(valid_data_sources or [])
+        self._valid_data_source_mapping = dict(valid_data_source_mapping or {})
 
         ## Other attributes
         self._config = config or {}
         self._data_source: Optional[str] = data_source
-        self._data_provider: Optional[DataProvider] = self._initialize_data_provider_instance(data_source=data_source)
+        self._data_providers: Dict[str, DataProvider] = {}
+        self._data_provider: Optional[DataProvider] = self._get_data_provider_instance(data_source=data_source)
 
         # Set initial status for the DataProvider_Wrapper instance
         self.set_status(DataProviderWrapperConnectionStatus.DISCONNECTED)
@@ -111,7 +124,7 @@ class DataProvider_Wrapper(DataModule):
 
         :return: The list of valid data sources.
         """
-        return self.__valid_data_sources
+        return self._valid_data_sources
 
     def set_valid_data_sources(self, valid_data_sources: List[str]) -> None:
         """
@@ -120,7 +133,7 @@ class DataProvider_Wrapper(DataModule):
         :param valid_data_sources: The list of valid data sources to set.
         :return: None.
         """
-        self.__valid_data_sources = valid_data_sources
+        self._valid_data_sources = valid_data_sources
 
     def add_valid_data_source(self, valid_data_source: str) -> None:
         """
@@ -129,7 +142,7 @@ class DataProvider_Wrapper(DataModule):
         :param valid_data_source: The valid data source to add.
         :return: None.
         """
-        self.__valid_data_sources.append(valid_data_source)
+        self._valid_data_sources.append(valid_data_source)
 
     def remove_valid_data_source(self, valid_data_source: str) -> None:
         """
@@ -138,7 +151,7 @@ class DataProvider_Wrapper(DataModule):
         :param valid_data_source: The valid data source to remove.
         :return: None.
         """
-        self.__valid_data_sources.remove(valid_data_source)
+        self._valid_data_sources.remove(valid_data_source)
 
     def get_valid_data_source_mapping(self) -> Dict[str, Type[DataProvider]]:
         """
@@ -146,7 +159,7 @@ class DataProvider_Wrapper(DataModule):
 
         :return: The mapping of valid data sources to their corresponding DataProvider classes.
         """
-        return self.__valid_data_source_mapping
+        return self._valid_data_source_mapping
 
     def set_valid_data_source_mapping(self, valid_data_source_mapping: Dict[str, Type[DataProvider]]) -> None:
         """
@@ -155,7 +168,7 @@ class DataProvider_Wrapper(DataModule):
         :param valid_data_source_mapping: The mapping of valid data sources to their corresponding DataProvider classes.
         :return: None.
         """
-        self.__valid_data_source_mapping = valid_data_source_mapping
+        self._valid_data_source_mapping = valid_data_source_mapping
 
     def update_valid_data_source_mapping(self, valid_data_source: str, data_provider_class: Type[DataProvider]) -> None:
         """
@@ -165,7 +178,7 @@ class DataProvider_Wrapper(DataModule):
         :param data_provider_class: The DataProvider class to map to the valid data source.
         :return: None.
         """
-        self.__valid_data_source_mapping[valid_data_source] = data_provider_class
+        self._valid_data_source_mapping[valid_data_source] = data_provider_class
 
     def get_config(self) -> Dict[str, Any]:
         """
@@ -246,7 +259,7 @@ class DataProvider_Wrapper(DataModule):
         elif self.validate_data_source(data_source=data_source):
             self.set_data_source(data_source=data_source)
             self.set_data_provider(
-                data_provider=self._initialize_data_provider_instance(data_source=data_source)
+                data_provider=self._get_data_provider_instance(data_source=data_source)
             )
 
     def register_data_provider(self, data_source: str, data_provider_class: Type[DataProvider]) -> None:
@@ -257,7 +270,11 @@ class DataProvider_Wrapper(DataModule):
         :param data_provider_class: The DataProvider class to register.
         :return: None.
         """
-        self.__valid_data_sources[data_source] = data_provider_class
+        if data_source not in self._valid_data_sources:
+            self._valid_data_sources.append(data_source)
+        self._valid_data_source_mapping[data_source] = data_provider_class
+        if self._discard_data_provider_instance(data_source=data_source):
+            self.set_data_provider(data_provider=self._get_data_provider_instance(data_source=data_source))
 
     def unregister_data_provider(self, data_source: str) -> None:
         """
@@ -266,8 +283,44 @@ class DataProvider_Wrapper(DataModule):
         :param data_source: The data source name to unregister.
         :return: None.
         """
-        if data_source in self.__valid_data_sources:
-            del self.__valid_data_sources[data_source]
+        if data_source in self._valid_data_sources:
+            self._valid_data_sources.remove(data_source)
+        self._valid_data_source_mapping.pop(data_source, None)
+        if self._discard_data_provider_instance(data_source=data_source):
+            self._data_provider = None
+
+    def _discard_data_provider_instance(self, data_source: str) -> bool:
+        """
+        Drop the cached data provider instance of a data source, disconnecting it.
+
+        :param data_source: The data source whose instance is dropped.
+        :return: True if the dropped instance was the current data provider, False otherwise.
+        """
+        data_provider = self._data_providers.pop(data_source, None)
+        if data_provider is None:
+            return False
+        if data_provider.is_connected():
+            data_provider.disconnect()
+        return data_provider is self._data_provider
+
+    def _get_data_provider_instance(self, data_source: str) -> DataProvider:
+        """
+        Get the data provider instance for a data source, initializing it on first use.
+
+        Instances are kept per data source, so switching back to a data source
+        reuses its provider instead of initializing a new one. A reused provider
+        that has been disconnected in the meantime is connected again.
+
+        :param data_source: The data source to use.
+        :return: The data provider instance.
+        """
+        data_provider = self._data_providers.get(data_source)
+        if data_provider is None:
+            data_provider = self._initialize_data_provider_instance(data_source=data_source)
+            self._data_providers[data_source] = data_provider
+        elif not data_provider.is_connected():
+            data_provider.connect()
+        return data_provider
 
     def _initialize_data_provider_instance(self, data_source: Optional[str] = None) -> DataProvider:
         """
@@ -281,7 +334,7 @@ class DataProvider_Wrapper(DataModule):
             data_source = self.get_data_source()
 
         # Get the data provider class from the mapping
-        data_provider_class = self.__valid_data_source_mapping.get(data_source, None)
+        data_provider_class = self._valid_data_source_mapping.get(data_source) if data_source is not None else None
         
         # Check if the data provider class is found
         if data_provider_class is None:
@@ -292,7 +345,7 @@ class DataProvider_Wrapper(DataModule):
         # Initialize the data provider instance
         try:
             data_provider_instance = data_provider_class(
-                log_level=self.get_log_level(),
+                log_level=self.log_level,
                 **self.get_config(),
             )
         except DataProviderError as e:
@@ -341,7 +394,8 @@ class DataProvider_Wrapper(DataModule):
 
     def disconnect(self) -> None:
         """
-        Disconnect from the specified data provider.
+        Disconnect from the specified data provider, and from the cached data
+        providers of the other data sources.
         """
         try:
             data_provider = self.get_data_provider()
@@ -350,6 +404,9 @@ class DataProvider_Wrapper(DataModule):
                     f"No data provider found for data source: '{self.get_data_source()}'."
                 )
             data_provider.disconnect()
+            for cached_data_provider in self._data_providers.values():
+                if cached_data_provider is not data_provider and cached_data_provider.is_connected():
+                    cached_data_provider.disconnect()
             self.set_status(DataProviderWrapperConnectionStatus.DISCONNECTED)
         except DataProviderError as e:
             raise e
@@ -365,6 +422,8 @@ class DataProvider_Wrapper(DataModule):
         """
         Enter the runtime context related to this object. Automatically connects to the data source.
         """
+        if not self.is_connected():
+            self.connect()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
@@ -379,7 +438,7 @@ class DataProvider_Wrapper(DataModule):
     def fetch_data(
         self,
         data_point: str,
-        return_data_type: type,
+        return_data_type: Type[Any],
         *args,
         **kwargs,
     ) -> Any:
@@ -396,7 +455,7 @@ class DataProvider_Wrapper(DataModule):
         :raises ReturnDataTypeNotMatchedError: If the return data type does not match.
         """
         # Get the data provider for the current data source
-        data_provider = self.get_data_provider()
+        data_provider = self._data_provider
 
         # Check if the data provider exists
         if data_provider is None:
@@ -404,15 +463,35 @@ class DataProvider_Wrapper(DataModule):
                 f"No data provider found for data source '{self.get_data_source()}'."
             )
 
-        # Fetch the data
-        data: Any = data_provider.fetch_data(
-            data_point=data_point, 
-            return_data_type=return_data_type, 
-            *args, 
-            **kwargs
-        )
-        
-        return data
+        # Fetch the data, passing the arguments positionally so that extra
+        # positional arguments reach the data method
+        return data_provider.fetch_data(data_point, return_data_type, *args, **kwargs)
+
+    def fetch_data_many(
+        self,
+        data_point: str,
+        return_data_type: Type[Any],
+        keys: Iterable[Any],
+        batch_size: Optional[int] = None,
+        **kwargs: Any,
+    ) -> List[Any]:
+        """
+        Fetch a data point for many keys from the specified data source.
+
+        :param data_point: The data point to fetch.
+        :param return_data_type: The expected type of each result.
+        :param keys: The keys to fetch, each a tuple of positional arguments or a single argument.
+        :param batch_size: Maximum number of keys per batch call.
+        :param kwargs: Keyword arguments passed to every call.
+        :return: The results, one per key, in order.
+        :raises DataProviderNotFoundError: If no provider is found for the data source.
+        """
+        data_provider = self._data_provider
+        if data_provider is None:
+            raise DataProviderNotFoundError(
+                f"No data provider found for data source '{self.get_data_source()}'."
+            )
+        return data_provider.fetch_data_many(data_point, return_data_type, keys, batch_size=batch_size, **kwargs)
 
     #################################################
     # Utility Methods
@@ -424,5 +503,4 @@ class DataProvider_Wrapper(DataModule):
         :param data_source: The data source to validate.
         :return: True if the data source is valid, False otherwise.
         """
-        print(self.get_valid_data_sources())
-        return data_source in self.__valid_data_sources
+        return data_source in self._valid_data_sources
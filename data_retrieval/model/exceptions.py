@@ -4,43 +4,70 @@
 # Description: Exception classes for data providers
 # Author: AbigailWilliams1692
 # Created: 2026-01-14
-# Updated: 2026-01-24
+# Updated: 2026-10-15
 #######################################################################
 
+#######################################################################
+# Import Packages
+#######################################################################
+# Standard Packages
+from enum import IntEnum
+from typing import ClassVar
+
+
+#######################################################################
+# Error Codes
+#######################################################################
+class ErrorCode(IntEnum):
+    """
+    Codes identifying the kind of a data provider error, so that callers can
+    catch the base exception once and branch on its code.
+    """
+    UNKNOWN = 0
+    INITIALIZATION = 1
+    CONNECTION = 2
+    FETCH = 3
+    DATA_METHOD_NOT_FOUND = 4
+    RETURN_DATA_TYPE_NOT_MATCHED = 5
+    VALIDATION = 6
+    DATA_PROVIDER_NOT_FOUND = 7
+    WRAPPER_CONNECTION = 8
+
+
 #######################################################################
 # Data Provider Exceptions
 #######################################################################
 class DataProviderError(Exception):
     """Base exception for data provider errors."""
-    pass
+    code: ClassVar[ErrorCode] = ErrorCode.UNKNOWN
 
 
 class DataProviderInitializationError(DataProviderError):
     """Raised when initialization of data provider fails."""
-    pass
+    code: ClassVar[ErrorCode] = ErrorCode.INITIALIZATION
 
 
 class DataProviderConnectionError(DataProviderError):
     """Raised when connection to data source fails."""
-    pass
+    code: ClassVar[ErrorCode] = ErrorCode.CONNECTION
 
 
 class DataFetchError(DataProviderError):
     """Raised when a query operation fails."""
-    pass
+    code: ClassVar[ErrorCode] = ErrorCode.FETCH
 
 class DataMethodNotFoundError(DataProviderError):
     """Raised when a requested data method is not found."""
-    pass
+    code: ClassVar[ErrorCode] = ErrorCode.DATA_METHOD_NOT_FOUND
 
 class ReturnDataTypeNotMatchedError(DataProviderError):
     """Raised when the retrieved data type does not match the expected type."""
-    pass
+    code: ClassVar[ErrorCode] = ErrorCode.RETURN_DATA_TYPE_NOT_MATCHED
 
 
 class ValidationError(DataProviderError):
     """Raised when data validation fails."""
-    pass
+    code: ClassVar[ErrorCode] = ErrorCode.VALIDATION
 
 
 #######################################################################
@@ -48,12 +75,35 @@ class ValidationError(DataProviderError):
 #######################################################################
 class DataProviderWrapperError(Exception):
     """Base exception for data provider wrapper errors."""
-    pass
+    code: ClassVar[ErrorCode] = ErrorCode.UNKNOWN
 
 class DataProviderNotFoundError(DataProviderWrapperError):
     """Raised when cannot find the corresponding data provider class."""
-    pass
+    code: ClassVar[ErrorCode] = ErrorCode.DATA_PROVIDER_NOT_FOUND
 
 class DataProviderWrapperConnectionError(DataProviderWrapperError):
     """Raised when connection to data provider fails."""
-    pass
\ No newline at end of file
+    code: ClassVar[ErrorCode] = ErrorCode.WRAPPER_CONNECTION
+
+
+#######################################################################
+# Public API
+#######################################################################
+__all__ = [
+    # Error Codes
+    "ErrorCode",
+
+    # Data Provider Exceptions
+    "DataProviderError",
+    "DataProviderInitializationError",
+    "DataProviderConnectionError",
+    "DataFetchError",
+    "DataMethodNotFoundError",
+    "ReturnDataTypeNotMatchedError",
+    "ValidationError",
+
+    # Data Provider Wrapper Exceptions
+    "DataProviderWrapperError",
+    "DataProviderNotFoundError",
+    "DataProviderWrapperConnectionError",
+]
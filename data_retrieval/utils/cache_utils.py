@@ -0,0 +1,152 @@
+#######################################################################
+# Project: Data Retrieval Module
+# File: cache_utils.py
+# Description: Util classes for in-process caching
+# Author: AbigailWilliams1692
+# Created: 2026-10-15
+# Updated: 2026-10-15
+#######################################################################
+
+#######################################################################
+# Import Packages
+#######################################################################
+# Standard Packages
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+#######################################################################
+# TTL Cache Class
+#######################################################################
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire a fixed time after being stored.
+    """
+
+    #################################################
+    # Constructor
+    #################################################
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0) -> None:
+        """
+        Initialize the cache.
+
+        :param maxsize: Maximum number of entries kept; the least recently used entry is evicted first.
+        :param ttl: Number of seconds an entry stays valid.
+        """
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    #################################################
+    # Getter Methods
+    #################################################
+    def get_maxsize(self) -> int:
+        """
+        Get the maximum number of entries.
+
+        :return: The maximum number of entries.
+        """
+        return self._maxsize
+
+    def get_ttl(self) -> float:
+        """
+        Get the entry time-to-live in seconds.
+
+        :return: The time-to-live in seconds.
+        """
+        return self._ttl
+
+    #################################################
+    # Core Instance Methods
+    #################################################
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a cached value.
+
+        :param key: The cache key.
+        :param default: Value returned when the key is missing or expired.
+        :return: The cached value, or default.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self._misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value, evicting the least recently used entries beyond maxsize.
+
+        :param key: The cache key.
+        :param value: The value to cache.
+        :return: None.
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, predicate: Optional[Callable[[Hashable, Any], bool]] = None) -> int:
+        """
+        Drop the entries matching a predicate, or every entry if none is given.
+
+        :param predicate: Callable taking (key, value) and returning True for entries to drop.
+        :return: Number of entries dropped.
+        """
+        with self._lock:
+            if predicate is None:
+                dropped = len(self._entries)
+                self._entries.clear()
+                return dropped
+            keys = [key for key, (_, value) in self._entries.items() if predicate(key, value)]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def clear(self) -> None:
+        """
+        Drop every entry and reset the statistics.
+
+        :return: None.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def info(self) -> Dict[str, Any]:
+        """
+        Get the cache statistics.
+
+        :return: Dictionary with hits, misses, size, maxsize and ttl.
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "size": len(self._entries),
+                "maxsize": self._maxsize,
+                "ttl": self._ttl,
+            }
+
+    def __len__(self) -> int:
+        """
+        Get the number of stored entries, including expired ones not yet purged.
+
+        :return: The number of entries.
+        """
+        return len(self._entries)
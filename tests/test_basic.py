@@ -10,6 +10,20 @@ import os
 # Add the package to the path for testing
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
+@pytest.fixture
+def stub_provider():
+    """Provide a DataProvider without a data source, to register data methods on."""
+    from data_retrieval import DataProvider
+
+    class StubProvider(DataProvider):
+        def _connect(self):
+            pass
+
+        def _disconnect(self):
+            pass
+
+    return StubProvider()
+
 # Test basic imports
 def test_basic_imports():
     """Test that basic classes can be imported."""
@@ -44,3 +58,100 @@ def test_package_structure():
     # Check that exceptions are available
     assert hasattr(data_retrieval, 'DataProviderError')
     assert hasattr(data_retrieval, 'DataFetchError')
+
+# Test error codes
+def test_exceptions_carry_an_error_code():
+    """Test that each exception class exposes its ErrorCode."""
+    from data_retrieval import DataProviderError, DataFetchError, ErrorCode
+
+    with pytest.raises(DataProviderError) as excinfo:
+        raise DataFetchError("boom")
+    assert excinfo.value.code is ErrorCode.FETCH
+    assert DataProviderError("boom").code is ErrorCode.UNKNOWN
+
+# Test log levels
+def test_set_log_level_applies_to_the_actual_logger():
+    """Test that set_log_level updates a logger whose level differs from the recorded one."""
+    import logging
+    from data_retrieval import DataModule
+
+    logger = logging.getLogger("test_set_log_level")
+    logger.setLevel(logging.DEBUG)
+    module = DataModule(logger=logger, log_level=logging.INFO)
+    module.set_log_level(logging.INFO)
+    assert logger.level == logging.INFO
+
+    first, second = DataModule(), DataModule()
+    first.get_logger(), second.get_logger()
+    second.set_log_level(logging.DEBUG)
+    first.set_log_level(logging.INFO)
+    assert first.get_logger().level == logging.INFO
+
+# Test batch fetching
+def test_fetch_data_many_uses_batch_data_method(stub_provider):
+    """Test that fetch_data_many batches keys and falls back to fetch_data."""
+    batches = []
+    provider = stub_provider
+    provider.add_data_method("square", lambda x: x * x)
+    provider.add_data_method("add", lambda x, y: x + y)
+    provider.add_batch_data_method("square", lambda keys: batches.append(keys) or [x * x for x in keys])
+
+    assert provider.fetch_data_many("square", int, range(5), batch_size=2) == [0, 1, 4, 9, 16]
+    assert batches == [[0, 1], [2, 3], [4]]
+    assert provider.fetch_data_many("add", int, [(1, 2), (3, 4)]) == [3, 7]
+
+# Test fetch cache
+def test_enable_cache_memoizes_fetch_data(stub_provider):
+    """Test that enable_cache serves repeated fetch_data calls from the cache."""
+    calls = []
+    provider = stub_provider
+    provider.add_data_method("echo", lambda x: calls.append(x) or x)
+    provider.add_data_method("write", lambda x: calls.append(x) or x)
+    provider.add_data_method("stream", lambda x: iter([x]))
+    provider.enable_cache(["echo", "stream"], ttl=60.0)
+
+    assert provider.fetch_data("echo", int, 1) == 1
+    assert provider.fetch_data("echo", int, 1) == 1
+    assert calls == [1]
+    assert provider.get_cache_info()["hits"] == 1
+
+    assert provider.invalidate_cache("echo") == 1
+    assert provider.fetch_data("echo", int, 1) == 1
+    assert calls == [1, 1]
+
+    # Data points outside the allowlist and iterator results are never memoized
+    provider.fetch_data("write", int, 2)
+    provider.fetch_data("write", int, 2)
+    assert calls == [1, 1, 2, 2]
+    assert list(provider.fetch_data("stream", object, 3)) == [3]
+    assert list(provider.fetch_data("stream", object, 3)) == [3]
+
+# Test concurrent fetching
+def test_fetch_data_concurrent_keeps_call_order(stub_provider):
+    """Test that fetch_data_concurrent returns results and exceptions in call order."""
+    from data_retrieval.model.exceptions import DataMethodNotFoundError
+
+    provider = stub_provider
+    provider.add_data_method("echo", lambda value: value)
+    calls = [{"data_point": "echo", "return_data_type": int, "value": i} for i in range(10)]
+
+    assert provider.fetch_data_concurrent(calls, limit=3) == list(range(10))
+
+    results = provider.fetch_data_concurrent(
+        [{"data_point": "missing", "return_data_type": int}, calls[1]], return_exceptions=True
+    )
+    assert isinstance(results[0], DataMethodNotFoundError) and results[1] == 1
+
+def test_fetch_data_concurrent_reuses_the_worker_pool(stub_provider):
+    """Test that repeated fetch_data_concurrent calls run on the same bounded worker pool."""
+    import threading
+
+    provider = stub_provider
+    provider.update_config("max_concurrency", 2)
+    provider.add_data_method("thread", lambda: threading.current_thread().name)
+    calls = [{"data_point": "thread", "return_data_type": str}] * 6
+
+    names = set(provider.fetch_data_concurrent(calls, limit=3) + provider.fetch_data_concurrent(calls, limit=3))
+
+    assert len(names) <= 2
+    provider.disconnect()
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Test suite for the REST API data provider, run against a local HTTP server.
+"""
+
+import pytest
+import sys
+import os
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Add the package to the path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from data_retrieval.data_provider.rest_api.rest_api_data_provider import RestAPI_DataProvider
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Answer GET requests with a JSON body, honouring If-None-Match for /etag."""
+
+    def do_GET(self):
+        server = self.server
+        server.requests.append((self.path, self.headers.get("If-None-Match")))
+        time.sleep(server.delay)
+
+        if self.path.startswith("/etag") and self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        body = json.dumps({"path": self.path}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if self.path.startswith("/etag"):
+            self.send_header("ETag", '"v1"')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class LocalAPI_DataProvider(RestAPI_DataProvider):
+    """REST provider counting its decoded bodies, optionally failing to decode them."""
+
+    decoded = 0
+    fail_decode = False
+
+    @staticmethod
+    def decode_json(content):
+        if LocalAPI_DataProvider.fail_decode:
+            raise RuntimeError("decode failed")
+        LocalAPI_DataProvider.decoded += 1
+        return RestAPI_DataProvider.decode_json(content)
+
+
+@pytest.fixture
+def server():
+    """Provide a local HTTP server recording the requests it receives."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.requests = []
+    server.delay = 0.0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    LocalAPI_DataProvider.decoded = 0
+    LocalAPI_DataProvider.fail_decode = False
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _provider(server, **config):
+    return LocalAPI_DataProvider(base_url=f"http://127.0.0.1:{server.server_address[1]}", **config)
+
+
+def _get_concurrently(provider, url, delay=0.1):
+    """Send a GET, then an identical one while the first is still in flight."""
+    outcomes = [None, None]
+
+    def get(index):
+        try:
+            outcomes[index] = provider._make_request(url, "GET")
+        except Exception as e:
+            outcomes[index] = e
+
+    threads = [threading.Thread(target=get, args=(index,)) for index in range(2)]
+    threads[0].start()
+    time.sleep(delay)
+    threads[1].start()
+    for thread in threads:
+        thread.join()
+    return outcomes
+
+# Test in-flight request coalescing
+def test_identical_gets_in_flight_share_one_request(server):
+    """Test that a GET joining an in-flight identical GET receives a copy of its response."""
+    server.delay = 0.3
+    provider = _provider(server)
+
+    first, second = _get_concurrently(provider, "/users")
+
+    assert first == second == {"path": "/users"} and second is not first
+    assert len(server.requests) == 1
+    assert provider._inflight == {}
+    provider.disconnect()
+
+def test_in_flight_errors_reach_joined_callers(server):
+    """Test that an error of the shared request is raised to every caller and cleaned up."""
+    server.delay = 0.3
+    LocalAPI_DataProvider.fail_decode = True
+    provider = _provider(server)
+
+    first, second = _get_concurrently(provider, "/users")
+
+    assert isinstance(first, RuntimeError) and second is first
+    assert len(server.requests) == 1
+    assert provider._inflight == {}
+    provider.disconnect()
+
+# Test GET response cache
+def test_get_cache_serves_repeated_gets(server):
+    """Test that a positive get_cache_ttl serves a repeated GET without a request."""
+    provider = _provider(server, get_cache_ttl=60)
+
+    first = provider._make_request("/users", "GET")
+    first["path"] = "changed"
+    second = provider._make_request("/users", "GET")
+
+    assert second == {"path": "/users"}
+    assert len(server.requests) == 1
+    provider.disconnect()
+
+def test_get_cache_skips_requests_with_custom_authentication(server):
+    """Test that responses to requests sent with a custom authentication are never cached."""
+    provider = _provider(server, get_cache_ttl=60, etag_cache_size=8)
+
+    provider._make_request("/etag", "GET", authentication=("user", "secret"))
+    provider._make_request("/etag", "GET", authentication=("other", "secret"))
+
+    assert server.requests == [("/etag", None), ("/etag", None)]
+    assert LocalAPI_DataProvider.decoded == 2
+    provider.disconnect()
+
+# Test ETag revalidation
+def test_etag_cache_revalidates_with_if_none_match(server):
+    """Test that a repeated GET is revalidated and a 304 answer reuses the cached body."""
+    provider = _provider(server, etag_cache_size=8)
+
+    first = provider._make_request("/etag", "GET")
+    second = provider._make_request("/etag", "GET")
+
+    assert second == first and second is not first
+    assert server.requests == [("/etag", None), ("/etag", '"v1"')]
+    assert LocalAPI_DataProvider.decoded == 1
+    provider.disconnect()
+
+def test_etag_cache_skips_decoding_an_unchanged_body(server):
+    """Test that a body identical to the cached one is not decoded again without an ETag."""
+    provider = _provider(server, etag_cache_size=8)
+
+    first = provider._make_request("/users", "GET")
+    second = provider._make_request("/users", "GET")
+
+    assert second == first and second is not first
+    assert len(server.requests) == 2
+    assert LocalAPI_DataProvider.decoded == 1
+    provider.disconnect()
+
+# Test page prefetching
+def test_iter_pages_stops_requesting_after_the_last_page(server):
+    """Test that no page past the last reported one is requested."""
+    class PagedAPI_DataProvider(LocalAPI_DataProvider):
+        def fetch_page(self, url, method="GET", params=None, **kwargs):
+            self._make_request(url, method, params=params)
+            return [params["page"]], {"pages": 2}
+
+    provider = PagedAPI_DataProvider(base_url=f"http://127.0.0.1:{server.server_address[1]}")
+
+    pages = []
+    for records, _ in provider.iter_pages("/items"):
+        pages.append(records)
+        time.sleep(0.2)
+    provider.disconnect()
+
+    assert pages == [[1], [2]]
+    assert [path for path, _ in server.requests] == ["/items?page=1", "/items?page=2"]
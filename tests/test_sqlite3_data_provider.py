@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+Test suite for the SQLite3 data provider.
+"""
+
+import pytest
+import sys
+import os
+import sqlite3
+import threading
+
+# Add the package to the path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from data_retrieval.data_provider.database.sqlite3_data_provider import SQLite3_DataProvider
+from data_retrieval.model.data_provider_wrapper import DataProvider_Wrapper
+from data_retrieval.model.exceptions import DataProviderConnectionError
+
+
+@pytest.fixture
+def provider(tmp_path):
+    """Provide a connected SQLite3 provider with an empty table."""
+    provider = SQLite3_DataProvider(db_file_path=str(tmp_path / "test.db"))
+    provider.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)", fetch_mode="none")
+    yield provider
+    provider.disconnect()
+
+# Test connections per thread
+def test_concurrent_threads_use_their_own_connection(provider):
+    """Test that writes from several threads all land in the database."""
+    def insert(i):
+        provider.execute("INSERT INTO items (name) VALUES (?)", (f"item_{i}",), fetch_mode="none")
+
+    threads = [threading.Thread(target=insert, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert provider.fetch_one("SELECT COUNT(*) FROM items")[0] == 8
+
+def test_thread_connections_close_when_their_thread_exits(provider):
+    """Test that the connection opened by a thread is closed once the thread exits."""
+    connections = []
+
+    def insert():
+        provider.execute("INSERT INTO items (name) VALUES ('x')", fetch_mode="none")
+        with provider.acquire_connection() as conn:
+            connections.append(conn)
+
+    thread = threading.Thread(target=insert)
+    thread.start()
+    thread.join()
+
+    assert len(provider._thread_connections) == 0
+    with pytest.raises(sqlite3.ProgrammingError):
+        connections[0].execute("SELECT 1")
+
+# Test transactions
+def test_transaction_rolls_back_on_error(provider):
+    """Test that a failing transaction() block leaves no rows behind."""
+    with pytest.raises(RuntimeError):
+        with provider.transaction():
+            provider.execute("INSERT INTO items (name) VALUES ('a')", fetch_mode="none")
+            raise RuntimeError("boom")
+
+    assert provider.fetch_all("SELECT * FROM items") == []
+    assert provider.table_exists("items")
+    assert not provider.table_exists("missing")
+
+# Test class metadata
+def test_name_and_type_come_from_the_class(provider):
+    """Test that get_name/get_type read the attributes of the concrete class."""
+    assert provider.get_name() == "SQLite3_DataProvider"
+    assert provider.get_type() == "Database_DataProvider"
+
+# Test multi-row VALUES rewrite
+def _traced_execute_many(provider, sql, params_list):
+    """Run execute_many and return the INSERT statements sent to SQLite."""
+    statements = []
+    with provider.transaction() as connection:
+        connection.set_trace_callback(statements.append)
+        try:
+            provider.execute_many(sql, params_list, fetch_mode="none")
+        finally:
+            connection.set_trace_callback(None)
+    return [statement for statement in statements if statement.lstrip().upper().startswith("INSERT")]
+
+def test_execute_many_rewrites_bare_markers_into_pages(provider):
+    """Test that a positional INSERT batch is sent as a few multi-row statements."""
+    rows = [(i, f"item_{i}") for i in range(1200)]
+    statements = _traced_execute_many(provider, "INSERT INTO items (id, name) VALUES (?, ?)", rows)
+
+    assert len(statements) == 3
+    assert provider.fetch_one("SELECT COUNT(*) FROM items")[0] == 1200
+
+def test_execute_many_falls_back_for_named_and_numbered_markers(provider):
+    """Test that statements the rewrite cannot repeat are executed row by row."""
+    numbered = _traced_execute_many(provider, "INSERT INTO items (id, name) VALUES (?1, ?2)", [(1, "x"), (2, "y")])
+    named = _traced_execute_many(
+        provider, "INSERT INTO items (id, name) VALUES (:id, :name)", [{"id": 3, "name": "z"}]
+    )
+
+    assert len(numbered) == 2 and len(named) == 1
+    assert [tuple(row) for row in provider.fetch_all("SELECT id, name FROM items WHERE id <= 3 ORDER BY id")] == [
+        (1, "x"), (2, "y"), (3, "z")
+    ]
+
+# Test fetch cache
+def test_fetch_cache_does_not_memoize_writes(provider):
+    """Test that writes run every time while reads are memoized when the fetch cache is enabled."""
+    provider.enable_cache(["fetch_all"])
+    for _ in range(3):
+        provider.fetch_data("execute", object, "INSERT INTO items (name) VALUES ('a')", fetch_mode="none")
+
+    assert len(provider.fetch_data("fetch_all", list, "SELECT * FROM items")) == 3
+    provider.fetch_data("fetch_all", list, "SELECT * FROM items")
+    assert provider.get_cache_info()["hits"] == 1
+
+# Test query cache
+def test_query_cache_returns_copies_and_invalidates_by_table(tmp_path):
+    """Test that cached reads cannot be altered by callers and are dropped by writes to their table."""
+    provider = SQLite3_DataProvider(db_file_path=str(tmp_path / "cache.db"), cache_ttl=60)
+    provider.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)", fetch_mode="none")
+    provider.execute("CREATE TABLE other (id INTEGER PRIMARY KEY)", fetch_mode="none")
+    provider.execute("INSERT INTO items (id, name) VALUES (1, 'a')", fetch_mode="none")
+    sql = "SELECT id, name FROM items"
+
+    rows = provider.fetch_all(sql, as_dict=True)
+    rows[0]["name"] = "changed"
+    assert provider.fetch_all(sql, as_dict=True) == [{"id": 1, "name": "a"}]
+    assert provider.get_query_cache_info()["hits"] == 1
+
+    provider.execute("INSERT INTO other (id) VALUES (1)", fetch_mode="none")
+    provider.fetch_all(sql, as_dict=True)
+    assert provider.get_query_cache_info()["hits"] == 2
+
+    provider.execute("INSERT INTO items (id, name) VALUES (2, 'b')", fetch_mode="none")
+    assert len(provider.fetch_all(sql, as_dict=True)) == 2
+    provider.disconnect()
+
+def test_query_cache_invalidates_cte_writes_and_transaction_commits(tmp_path):
+    """Test that WITH ... INSERT statements and committed transaction() blocks drop cached reads."""
+    provider = SQLite3_DataProvider(db_file_path=str(tmp_path / "cache.db"), cache_ttl=60)
+    provider.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)", fetch_mode="none")
+    sql = "SELECT COUNT(*) FROM items"
+
+    assert provider.fetch_one(sql)[0] == 0
+    provider.execute("WITH v(n) AS (SELECT 'a') INSERT INTO items (name) SELECT n FROM v", fetch_mode="none")
+    assert provider.fetch_one(sql)[0] == 1
+
+    # A reader on another thread caches the pre-commit count while the block runs
+    with provider.transaction():
+        provider.execute("INSERT INTO items (name) VALUES ('b')", fetch_mode="none")
+        reader = threading.Thread(target=provider.fetch_one, args=(sql,))
+        reader.start()
+        reader.join()
+    assert provider.fetch_one(sql)[0] == 2
+    provider.disconnect()
+
+# Test connection pooling
+def test_connection_pool_bounds_open_connections(tmp_path):
+    """Test that threads share at most max_connections pooled connections."""
+    provider = SQLite3_DataProvider(db_file_path=str(tmp_path / "pool.db"), max_connections=2)
+    provider.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)", fetch_mode="none")
+
+    def insert(i):
+        provider.execute("INSERT INTO items (name) VALUES (?)", (f"item_{i}",), fetch_mode="none")
+
+    threads = [threading.Thread(target=insert, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    info = provider.get_connection_pool().info()
+    assert info["size"] <= 2 and info["in_use"] == 0
+    assert provider.is_connected() and provider.get_connection() is None and provider.get_cursor() is None
+    assert provider.fetch_one("SELECT COUNT(*) FROM items")[0] == 8
+    provider.disconnect()
+    assert provider.get_connection_pool() is None and not provider.is_connected()
+
+# Test buffered writes
+def test_buffered_writes_flush_on_size_and_disconnect(tmp_path):
+    """Test that buffered writes are deduplicated by key and flushed in batches."""
+    db_file_path = str(tmp_path / "buffer.db")
+    provider = SQLite3_DataProvider(db_file_path=db_file_path, write_buffer_size=3)
+    provider.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)", fetch_mode="none")
+    sql = "INSERT OR REPLACE INTO items (id, name) VALUES (?, ?)"
+
+    provider.buffer_write(sql, (1, "a"), key=1)
+    provider.buffer_write(sql, (1, "b"), key=1)
+    assert provider.get_pending_write_count() == 1
+    provider.buffer_write(sql, (2, "c"))
+    provider.buffer_write(sql, (3, "d"))
+    assert provider.get_pending_write_count() == 0
+    assert [tuple(row) for row in provider.fetch_all("SELECT * FROM items ORDER BY id")] == [(1, "b"), (2, "c"), (3, "d")]
+
+    provider.buffer_write(sql, (4, "e"))
+    provider.disconnect()
+    provider = SQLite3_DataProvider(db_file_path=db_file_path)
+    assert provider.fetch_one("SELECT name FROM items WHERE id = 4")[0] == "e"
+    provider.disconnect()
+
+def test_failed_buffered_writes_stay_buffered(tmp_path):
+    """Test that a failing statement neither loses its writes nor blocks the other statements."""
+    provider = SQLite3_DataProvider(db_file_path=str(tmp_path / "buffer.db"))
+    provider.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)", fetch_mode="none")
+
+    provider.buffer_write("INSERT INTO missing (name) VALUES (?)", ("lost?",))
+    provider.buffer_write("INSERT INTO items (name) VALUES (?)", ("kept",))
+    with pytest.raises(sqlite3.OperationalError):
+        provider.flush_writes()
+    assert provider.get_pending_write_count() == 1
+    assert provider.fetch_one("SELECT name FROM items")[0] == "kept"
+
+    with pytest.raises(DataProviderConnectionError):
+        provider.disconnect()
+    assert not provider.is_connected()
+    assert provider.get_pending_write_count() == 1
+
+    provider.connect()
+    provider.execute("CREATE TABLE missing (name TEXT)", fetch_mode="none")
+    assert provider.flush_writes() == 1
+    assert provider.fetch_one("SELECT name FROM missing")[0] == "lost?"
+    provider.disconnect()
+
+def test_buffered_writes_are_not_flushed_inside_a_transaction(tmp_path):
+    """Test that a size-triggered flush waits for the transaction, so a rollback loses no writes."""
+    provider = SQLite3_DataProvider(db_file_path=str(tmp_path / "buffer.db"), write_buffer_size=2)
+    provider.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)", fetch_mode="none")
+
+    with pytest.raises(RuntimeError):
+        with provider.transaction():
+            for i in range(3):
+                provider.buffer_write("INSERT INTO items (name) VALUES (?)", (f"item_{i}",))
+            raise RuntimeError("rolled back")
+
+    assert provider.get_pending_write_count() == 3
+    assert provider.flush_writes() == 3
+    assert provider.fetch_one("SELECT COUNT(*) FROM items")[0] == 3
+    provider.disconnect()
+    provider.disconnect()
+
+# Test bulk inserts
+def test_bulk_insert_spans_several_statements(provider):
+    """Test that bulk_insert writes more rows than fit in one statement."""
+    rows = [(i, f"item_{i}") for i in range(1200)]
+    assert provider.bulk_insert("items", ["id", "name"], rows) == 1200
+    assert provider.bulk_insert("items", ["id", "name"], [(1, "replaced")], conflict="replace") == 1
+
+    assert provider.fetch_one("SELECT COUNT(*) FROM items")[0] == 1200
+    assert provider.fetch_one("SELECT name FROM items WHERE id = 1")[0] == "replaced"
+
+    assert provider.bulk_insert("items", ["name", "id"], [{"id": 5000, "name": "mapped", "extra": 1}]) == 1
+    assert provider.fetch_one("SELECT name FROM items WHERE id = 5000")[0] == "mapped"
+
+# Test prepared statements
+def test_prepared_statement_runs_in_a_loop(provider):
+    """Test that a prepared statement can be executed repeatedly inside a transaction."""
+    statement = provider.prepare("INSERT INTO items (name) VALUES (?)")
+    with provider.transaction():
+        for i in range(5):
+            statement.execute((f"item_{i}",))
+    statement.execute_many([("x",), ("y",)])
+
+    assert provider.fetch_one("SELECT COUNT(*) FROM items")[0] == 7
+    query = provider.prepare("SELECT name FROM items WHERE name = ?")
+    assert query.execute(("x",)) == provider.execute("SELECT name FROM items WHERE name = ?", ("x",))
+
+# Test data provider wrapper
+def test_wrapper_reconnects_a_provider_it_switches_back_to(tmp_path):
+    """Test that switching back to a disconnected data source connects its provider again."""
+    wrapper = DataProvider_Wrapper(
+        data_source="a",
+        valid_data_sources=["a", "b"],
+        valid_data_source_mapping={"a": SQLite3_DataProvider, "b": SQLite3_DataProvider},
+        db_file_path=str(tmp_path / "wrapper.db"),
+    )
+    wrapper.disconnect()
+    wrapper.switch_data_provider("b")
+    wrapper.switch_data_provider("a")
+
+    assert wrapper.is_connected()
+    assert wrapper.fetch_data("fetch_one", object, "SELECT 1")[0] == 1
+
+def test_wrapper_validates_against_the_valid_data_sources(tmp_path):
+    """Test that a data source removed from the valid data sources no longer validates."""
+    wrapper = DataProvider_Wrapper(
+        data_source="a",
+        valid_data_sources=["a", "b"],
+        valid_data_source_mapping={"a": SQLite3_DataProvider, "b": SQLite3_DataProvider},
+        db_file_path=str(tmp_path / "wrapper.db"),
+    )
+    wrapper.remove_valid_data_source("b")
+
+    assert wrapper.validate_data_source("a") and not wrapper.validate_data_source("b")
+    with pytest.raises(KeyError):
+        wrapper.set_data_source("b")
+    wrapper.disconnect()
+
+def test_wrapper_disconnects_every_cached_provider(tmp_path):
+    """Test that disconnecting or re-registering closes the providers of other data sources."""
+    wrapper = DataProvider_Wrapper(
+        data_source="a",
+        valid_data_sources=["a", "b"],
+        valid_data_source_mapping={"a": SQLite3_DataProvider, "b": SQLite3_DataProvider},
+        db_file_path=str(tmp_path / "wrapper.db"),
+    )
+    provider_a = wrapper.get_data_provider()
+    wrapper.switch_data_provider("b")
+    provider_b = wrapper.get_data_provider()
+
+    wrapper.register_data_provider("a", SQLite3_DataProvider)
+    assert not provider_a.is_connected()
+
+    wrapper.register_data_provider("b", SQLite3_DataProvider)
+    assert not provider_b.is_connected()
+    assert wrapper.get_data_provider() is not provider_b and wrapper.is_connected()
+
+    wrapper.switch_data_provider("a")
+    with wrapper:
+        pass
+    assert not any(provider.is_connected() for provider in wrapper._data_providers.values())